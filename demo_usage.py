@@ -3,58 +3,67 @@
 Demo script showing all the new Google Cloud reCAPTCHA solving features.
 """
 
+import asyncio
 import logging
-from playwright.sync_api import sync_playwright
-from playwright_recaptcha import recaptchav2
+import os
+import sys
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
 
-# Setup logging to see debug information
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Setup logging, set DEBUG=1 to see debug information
+logging.basicConfig(
+    level=logging.INFO if os.environ.get("DEBUG") == "1" else logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+@asynccontextmanager
+async def new_demo_page(browser):
+    """Open a page in a fresh context of the shared browser."""
+    context = await browser.new_context()
+    
+    try:
+        yield await context.new_page()
+    finally:
+        await context.close()
 
-def demo_basic_usage():
+async def demo_basic_usage(browser):
     """Demo basic usage without credentials (uses free API)."""
-    print("🔷 DEMO 1: Basic usage (free API fallback)")
+    from playwright_recaptcha import recaptchav2
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        page = browser.new_page()
-        
+    async with new_demo_page(browser) as page:
         # Basic solver - will use free Google API if no credentials
-        solver = recaptchav2.SyncSolver(page, debug=True)
+        solver = recaptchav2.AsyncSolver(page, debug=True)
+        print("🔷 DEMO 1: Basic usage (free API fallback)")
         print("✅ Solver initialized - will fall back to free API")
         solver.close()
-        browser.close()
 
-def demo_forced_google_cloud():
+async def demo_forced_google_cloud(browser):
     """Demo forced Google Cloud usage (requires credentials)."""
-    print("\n🔷 DEMO 2: Forced Google Cloud (requires credentials)")
+    from playwright_recaptcha import recaptchav2
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        page = browser.new_page()
+    async with new_demo_page(browser) as page:
+        print("\n🔷 DEMO 2: Forced Google Cloud (requires credentials)")
         
         try:
             # This will fail because no credentials provided but Google Cloud is forced
-            solver = recaptchav2.SyncSolver(
+            solver = recaptchav2.AsyncSolver(
                 page, 
                 force_google_cloud=True,
                 debug=True
             )
         except ValueError as e:
             print(f"✅ Correctly failed: {e}")
-        
-        browser.close()
 
-def demo_with_credentials():
+async def demo_with_credentials(browser):
     """Demo with credentials file (production-ready)."""
-    print("\n🔷 DEMO 3: With credentials file (production-ready)")
+    from playwright_recaptcha import recaptchav2
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        page = browser.new_page()
+    async with new_demo_page(browser) as page:
+        print("\n🔷 DEMO 3: With credentials file (production-ready)")
         
         try:
             # This would work with real credentials
-            solver = recaptchav2.SyncSolver(
+            solver = recaptchav2.AsyncSolver(
                 page,
                 google_cloud_credentials="/path/to/your/credentials.json",
                 force_google_cloud=True,
@@ -63,28 +72,20 @@ def demo_with_credentials():
             print("✅ Would work with real credentials file")
         except FileNotFoundError:
             print("✅ Correctly validates credentials file exists")
-        
-        browser.close()
 
-def demo_async_usage():
-    """Demo async version."""
-    print("\n🔷 DEMO 4: Async version")
-    
-    import asyncio
-    from playwright.async_api import async_playwright
-    
-    async def async_demo():
-        async with async_playwright() as playwright:
-            browser = await playwright.firefox.launch(headless=True)
-            page = await browser.new_page()
-            
-            # Async solver with debug
-            solver = recaptchav2.AsyncSolver(page, debug=True)
-            print("✅ Async solver initialized")
-            solver.close()
+async def run_demos():
+    """Run the independent demos concurrently against one shared browser."""
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        
+        try:
+            await asyncio.gather(
+                demo_basic_usage(browser),
+                demo_forced_google_cloud(browser),
+                demo_with_credentials(browser),
+            )
+        finally:
             await browser.close()
-    
-    asyncio.run(async_demo())
 
 def show_usage_examples():
     """Show code examples."""
@@ -120,25 +121,29 @@ async with recaptchav2.AsyncSolver(
 """)
 
 def main():
-    print("🚀 Playwright-reCAPTCHA Google Cloud Integration Demo")
-    print("=" * 60)
+    # Banners and feature lists are only worth printing to a terminal
+    interactive = sys.stderr.isatty()
+    
+    if interactive:
+        print("🚀 Playwright-reCAPTCHA Google Cloud Integration Demo")
+        print("=" * 60)
     
-    demo_basic_usage()
-    demo_forced_google_cloud() 
-    demo_with_credentials()
-    demo_async_usage()
-    show_usage_examples()
+    asyncio.run(run_demos())
     
-    print("\n🎉 Demo Complete!")
-    print("\n📝 Key Features:")
-    print("✅ Rock-solid Google Cloud Speech-to-Text API integration")
-    print("✅ Automatic fallback to free API when credentials not provided")
-    print("✅ Force Google Cloud option with error handling")
-    print("✅ Comprehensive debug logging")
-    print("✅ Environment variable support")
-    print("✅ Both sync and async support")
-    print("✅ Production-ready error handling")
-    print("✅ Clear success/failure messages")
+    if interactive:
+        show_usage_examples()
+        print("\n".join([
+            "\n🎉 Demo Complete!",
+            "\n📝 Key Features:",
+            "✅ Rock-solid Google Cloud Speech-to-Text API integration",
+            "✅ Automatic fallback to free API when credentials not provided",
+            "✅ Force Google Cloud option with error handling",
+            "✅ Comprehensive debug logging",
+            "✅ Environment variable support",
+            "✅ Both sync and async support",
+            "✅ Production-ready error handling",
+            "✅ Clear success/failure messages",
+        ]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -13,6 +13,7 @@ from .errors import (
     RecaptchaTimeoutError,
 )
 from .recaptchav2 import AsyncSolver as AsyncSolverV2
+from .recaptchav2 import SolverPool as SolverPoolV2
 from .recaptchav2 import SyncSolver as SyncSolverV2
 from .recaptchav3 import AsyncSolver as AsyncSolverV3
 from .recaptchav3 import SyncSolver as SyncSolverV3
@@ -26,6 +27,7 @@ __all__ = [
     "RecaptchaTimeoutError",
     "AsyncSolverV2",
     "SyncSolverV2",
+    "SolverPoolV2",
     "AsyncSolverV3",
     "SyncSolverV3",
 ]
@@ -27,10 +27,19 @@ class RecaptchaSolveError(RecaptchaError):
 
 
 class RecaptchaRateLimitError(RecaptchaSolveError):
-    """An exception raised when the reCAPTCHA rate limit has been exceeded."""
+    """
+    An exception raised when the reCAPTCHA rate limit has been exceeded.
 
-    def __init__(self) -> None:
+    Attributes
+    ----------
+    retry_after : Optional[float]
+        The suggested time in seconds to wait before solving again,
+        growing while the rate limit keeps being hit. None if unknown.
+    """
+
+    def __init__(self, retry_after: Optional[float] = None) -> None:
         super().__init__("The reCAPTCHA rate limit has been exceeded.")
+        self.retry_after = retry_after
 
 
 class RecaptchaTimeoutError(RecaptchaSolveError):
@@ -1,5 +1,7 @@
 """reCAPTCHA v2 solver for Playwright."""
 from .async_solver import AsyncSolver
+from .base_solver import get_speech_client
+from .solver_pool import SolverPool
 from .sync_solver import SyncSolver
 
-__all__ = ["AsyncSolver", "SyncSolver"]
+__all__ = ["AsyncSolver", "SolverPool", "SyncSolver", "get_speech_client"]
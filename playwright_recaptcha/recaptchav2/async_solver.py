@@ -13,7 +13,8 @@ from typing import Any, BinaryIO, Dict, List, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
 import speech_recognition
-from playwright.async_api import Locator, Page, Response
+from playwright.async_api import APIResponse, BrowserContext, Locator, Page, Route
+from playwright.async_api import Error as PlaywrightError
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 from tenacity import (
@@ -29,7 +30,7 @@ from ..errors import (
     RecaptchaRateLimitError,
     RecaptchaSolveError,
 )
-from .base_solver import BaseSolver
+from .base_solver import CHALLENGE_URL_PATTERN, BaseSolver
 from .recaptcha_box import AsyncRecaptchaBox
 from .translations import OBJECT_TRANSLATIONS, ORIGINAL_LANGUAGE_AUDIO
 
@@ -84,6 +85,9 @@ class AsyncSolver(BaseSolver[Page]):
     force_google_cloud : bool, optional
         If True, forces the use of Google Cloud Speech-to-Text API and raises
         an error if credentials are not provided, by default False.
+    speech_client : Optional[SpeechClient], optional
+        The Google Cloud Speech-to-Text client to use with an API key, by default None.
+        If None, a client shared by all solvers using the same API key will be used.
     """
 
     async def __aenter__(self) -> AsyncSolver:
@@ -92,6 +96,25 @@ class AsyncSolver(BaseSolver[Page]):
     async def __aexit__(self, *_: Any) -> None:
         self.close()
 
+    @classmethod
+    async def from_context(cls, context: BrowserContext, **kwargs: Any) -> AsyncSolver:
+        """
+        Create a solver on a new page in the given browser context.
+
+        Parameters
+        ----------
+        context : BrowserContext
+            The browser context to open the page in.
+        **kwargs
+            Keyword arguments passed to the solver.
+
+        Returns
+        -------
+        AsyncSolver
+            The solver for the new page.
+        """
+        return cls(await context.new_page(), **kwargs)
+
     @staticmethod
     async def _get_task_object(recaptcha_box: AsyncRecaptchaBox) -> Optional[str]:
         """
@@ -135,13 +158,37 @@ class AsyncSolver(BaseSolver[Page]):
 
         return None
 
-    async def _response_callback(self, response: Response) -> None:
+    async def _route_handler(self, route: Route) -> None:
+        """
+        The route handler for intercepted payload and userverify requests.
+
+        Parameters
+        ----------
+        route : Route
+            The intercepted route.
+        """
+        try:
+            response = await route.fetch()
+            await route.fulfill(response=response)
+        except PlaywrightError:
+            # Never leave the page's request hanging, let it go through
+            # on its own instead, this attempt just won't see the response
+            try:
+                await route.continue_()
+            except PlaywrightError:
+                pass  # The page or the request is already gone
+
+            return
+
+        await self._response_callback(response)
+
+    async def _response_callback(self, response: APIResponse) -> None:
         """
         The callback for intercepting payload and userverify responses.
 
         Parameters
         ----------
-        response : Response
+        response : APIResponse
             The response.
         """
         if (
@@ -157,6 +204,7 @@ class AsyncSolver(BaseSolver[Page]):
 
             if token_match is not None:
                 self._token = token_match.group(1)
+                self._on_success()
 
     async def _get_capsolver_response(
         self, recaptcha_box: AsyncRecaptchaBox, image_data: bytes
@@ -315,11 +363,8 @@ class AsyncSolver(BaseSolver[Page]):
 
         self._logger.debug("Using Google Cloud Speech-to-Text API")
         
-        # Check if we're using an API key or JSON file
-        is_api_key = (self._google_cloud_credentials.startswith('AIza') and 
-                     len(self._google_cloud_credentials) >= 35)
-        
-        if is_api_key:
+        # The credential type was detected when the credentials were validated
+        if self._credential_type == "api_key":
             return await self._transcribe_with_api_key(audio_url, language=language)
         else:
             return await self._transcribe_with_json_credentials(audio_url, language=language)
@@ -327,52 +372,32 @@ class AsyncSolver(BaseSolver[Page]):
     async def _transcribe_with_api_key(self, audio_url: str, *, language: str = "en-US") -> Optional[str]:
         """Transcribe using Google Cloud API key."""
         try:
-            from google.cloud import speech
-            from google.api_core.client_options import ClientOptions
-            
             loop = asyncio.get_event_loop()
-            response = await self._page.request.get(audio_url)
-            self._logger.debug(f"Downloaded audio file, size: {len(await response.body())} bytes")
 
-            wav_audio = BytesIO()
-            mp3_audio = BytesIO(await response.body())
+            # Set up the Speech client while the audio is downloading
+            response, client = await asyncio.gather(
+                self._page.request.get(audio_url),
+                loop.run_in_executor(None, self._get_speech_client),
+            )
 
-            try:
-                audio: AudioSegment = await loop.run_in_executor(
-                    None, AudioSegment.from_mp3, mp3_audio
-                )
-                self._logger.debug(f"Audio conversion successful, duration: {len(audio)}ms")
-            except CouldntDecodeError as e:
-                self._logger.error(f"Failed to decode MP3 audio: {e}")
-                return None
+            self._logger.debug(f"Downloaded audio file, size: {len(await response.body())} bytes")
 
-            # Convert to mono for Google Cloud API
-            audio = audio.set_channels(1)
-            await loop.run_in_executor(
-                None, functools.partial(audio.export, wav_audio, format="wav")
+            audio_content = await loop.run_in_executor(
+                None, self._convert_to_linear16, await response.body()
             )
-            wav_audio.seek(0)
-
-            # Use Google Cloud Speech client with API key
-            def create_client_and_recognize():
-                client_options = ClientOptions(api_key=self._google_cloud_credentials)
-                client = speech.SpeechClient(client_options=client_options)
-
-                audio_content = wav_audio.getvalue()
-                audio = speech.RecognitionAudio(content=audio_content)
-                config = speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                    language_code=language,
-                )
 
-                response = client.recognize(config=config, audio=audio)
-                return response
+            if audio_content is None:
+                return None
 
             self._logger.debug("Calling Google Cloud Speech API with API key")
-            response = await loop.run_in_executor(None, create_client_and_recognize)
+            result = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self._streaming_recognize, client, audio_content, language=language
+                ),
+            )
 
-            if response.results:
-                result = response.results[0].alternatives[0].transcript
+            if result:
                 self._logger.info(f"Google Cloud API transcription successful: '{result}'")
                 print("✅ CAPTCHA solved with your own Google Cloud API keys")
                 return result
@@ -391,25 +416,14 @@ class AsyncSolver(BaseSolver[Page]):
             response = await self._page.request.get(audio_url)
             self._logger.debug(f"Downloaded audio file, size: {len(await response.body())} bytes")
 
-            wav_audio = BytesIO()
-            mp3_audio = BytesIO(await response.body())
+            audio_content = await loop.run_in_executor(
+                None, self._convert_to_mono_wav, await response.body()
+            )
 
-            try:
-                audio: AudioSegment = await loop.run_in_executor(
-                    None, AudioSegment.from_mp3, mp3_audio
-                )
-                self._logger.debug(f"Audio conversion successful, duration: {len(audio)}ms")
-            except CouldntDecodeError as e:
-                self._logger.error(f"Failed to decode MP3 audio: {e}")
+            if audio_content is None:
                 return None
 
-            # Convert to mono for Google Cloud API (JSON credentials path)
-            audio = audio.set_channels(1)
-            await loop.run_in_executor(
-                None, functools.partial(audio.export, wav_audio, format="wav")
-            )
-            wav_audio.seek(0)
-
+            wav_audio = BytesIO(audio_content)
             recognizer = speech_recognition.Recognizer()
 
             async with AsyncAudioFile(wav_audio) as source:
@@ -790,81 +804,92 @@ class AsyncSolver(BaseSolver[Page]):
                 "You must provide a CapSolver API key to solve image challenges."
             )
 
-        self._token = None
-        attempts = attempts or self._attempts
+        # Only intercept the challenge requests, and only while solving, so
+        # the page's other traffic never has to pass through the solver
+        await self._page.route(CHALLENGE_URL_PATTERN, self._route_handler)
 
-        if wait:
-            retry = AsyncRetrying(
-                sleep=self._page.wait_for_timeout,
-                stop=stop_after_delay(wait_timeout),
-                wait=wait_fixed(0.25),
-                retry=retry_if_exception_type(RecaptchaNotFoundError),
-                reraise=True,
-            )
+        try:
+            self._token = None
+            attempts = attempts or self._attempts
+
+            if wait:
+                retry = AsyncRetrying(
+                    sleep=self._page.wait_for_timeout,
+                    stop=stop_after_delay(wait_timeout),
+                    wait=wait_fixed(0.25),
+                    retry=retry_if_exception_type(RecaptchaNotFoundError),
+                    reraise=True,
+                )
 
-            recaptcha_box = await retry(
-                lambda: AsyncRecaptchaBox.from_frames(self._page.frames)
-            )
-        else:
-            recaptcha_box = await AsyncRecaptchaBox.from_frames(self._page.frames)
+                recaptcha_box = await retry(
+                    lambda: AsyncRecaptchaBox.from_frames(self._page.frames)
+                )
+            else:
+                recaptcha_box = await AsyncRecaptchaBox.from_frames(self._page.frames)
 
-        if await recaptcha_box.rate_limit_is_visible():
-            raise RecaptchaRateLimitError
+            if await recaptcha_box.rate_limit_is_visible():
+                raise RecaptchaRateLimitError
 
-        if await recaptcha_box.checkbox.is_visible():
-            click_timestamp = time.time()
-            await self._click_checkbox(recaptcha_box)
+            if await recaptcha_box.checkbox.is_visible():
+                click_timestamp = time.time()
+                await self._click_checkbox(recaptcha_box)
 
-            if self._token is not None:
-                return self._token
+                if self._token is not None:
+                    return self._token
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not await recaptcha_box.any_challenge_is_visible()
-                or await recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    await self._page.wait_for_timeout(250)
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not await recaptcha_box.any_challenge_is_visible()
+                    or await recaptcha_box.challenge_is_solved()
+                ):
+                    while self._token is None:
+                        await self._page.wait_for_timeout(250)
 
-                return self._token
+                    return self._token
 
-            time_to_wait = max(1 - (time.time() - click_timestamp), 0)
-            await self._page.wait_for_timeout(time_to_wait * 1000)
+                time_to_wait = max(1 - (time.time() - click_timestamp), 0)
+                await self._page.wait_for_timeout(time_to_wait * 1000)
 
-        while not await recaptcha_box.any_challenge_is_visible():
-            await self._page.wait_for_timeout(250)
+            while not await recaptcha_box.any_challenge_is_visible():
+                await self._page.wait_for_timeout(250)
 
-        if image_challenge and await recaptcha_box.image_challenge_button.is_visible():
-            await recaptcha_box.image_challenge_button.click()
-        elif (
-            not image_challenge
-            and await recaptcha_box.audio_challenge_button.is_visible()
-        ):
-            await recaptcha_box.audio_challenge_button.click()
+            if image_challenge and await recaptcha_box.image_challenge_button.is_visible():
+                await recaptcha_box.image_challenge_button.click()
+            elif (
+                not image_challenge
+                and await recaptcha_box.audio_challenge_button.is_visible()
+            ):
+                await recaptcha_box.audio_challenge_button.click()
 
-        if image_challenge:
-            image = recaptcha_box.image_challenge.locator("img").first
-            image_url = await image.get_attribute("src")
-            self._payload_response = await self._page.request.get(image_url)
+            if image_challenge:
+                image = recaptcha_box.image_challenge.locator("img").first
+                image_url = await image.get_attribute("src")
+                self._payload_response = await self._page.request.get(image_url)
 
-        while attempts > 0:
-            self._token = None
+            while attempts > 0:
+                self._token = None
 
-            if image_challenge:
-                await self._solve_image_challenge(recaptcha_box)
-            else:
-                await self._solve_audio_challenge(recaptcha_box)
+                if image_challenge:
+                    await self._solve_image_challenge(recaptcha_box)
+                else:
+                    await self._solve_audio_challenge(recaptcha_box)
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not await recaptcha_box.any_challenge_is_visible()
-                or await recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    await self._page.wait_for_timeout(250)
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not await recaptcha_box.any_challenge_is_visible()
+                    or await recaptcha_box.challenge_is_solved()
+                ):
+                    while self._token is None:
+                        await self._page.wait_for_timeout(250)
 
-                return self._token
+                    return self._token
 
-            attempts -= 1
+                attempts -= 1
 
-        raise RecaptchaSolveError
+            raise RecaptchaSolveError
+        except RecaptchaRateLimitError as error:
+            # Tell the caller how long to back off, longer the more often it happens
+            error.retry_after = self._on_rate_limit()
+            raise
+        finally:
+            await self._page.unroute(CHALLENGE_URL_PATTERN, self._route_handler)
@@ -1,22 +1,118 @@
-import json
+from __future__ import annotations
+
 import logging
 import os
+import re
+import threading
 from abc import ABC, abstractmethod
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Generic, Iterable, Optional, TypeVar, Union
-
-from playwright.async_api import APIResponse as AsyncAPIResponse
-from playwright.async_api import Page as AsyncPage
-from playwright.async_api import Response as AsyncResponse
-from playwright.sync_api import APIResponse as SyncAPIResponse
-from playwright.sync_api import Page as SyncPage
-from playwright.sync_api import Response as SyncResponse
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from pydub import AudioSegment
+from pydub.exceptions import CouldntDecodeError
 
 from .recaptcha_box import RecaptchaBox
 
-PageT = TypeVar("PageT", AsyncPage, SyncPage)
-APIResponse = Union[AsyncAPIResponse, SyncAPIResponse]
-Response = Union[AsyncResponse, SyncResponse]
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+if TYPE_CHECKING:
+    from google.cloud.speech import SpeechClient
+    from playwright.async_api import APIResponse as AsyncAPIResponse
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Page as AsyncPage
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import APIResponse as SyncAPIResponse
+    from playwright.sync_api import BrowserContext as SyncBrowserContext
+    from playwright.sync_api import Page as SyncPage
+    from playwright.sync_api import Route as SyncRoute
+
+    APIResponse = Union[AsyncAPIResponse, SyncAPIResponse]
+    BrowserContext = Union[AsyncBrowserContext, SyncBrowserContext]
+    Route = Union[AsyncRoute, SyncRoute]
+
+# The page types are only named here, so neither Playwright API is imported at runtime
+PageT = TypeVar("PageT", "AsyncPage", "SyncPage")
+
+# The challenge requests the solvers intercept, matched by the Playwright driver
+CHALLENGE_URL_PATTERN = re.compile(r"/recaptcha/(api2|enterprise)/(payload|userverify)")
+
+STREAMING_SAMPLE_RATE = 16000
+STREAMING_CHUNK_SIZE = 3200  # 100 ms of 16-bit mono audio at 16 kHz
+
+BACKOFF_BASE_DELAY = 2.0  # seconds
+BACKOFF_CAP = 4.0
+
+_REQUIRED_SA_FIELDS = frozenset(
+    {"type", "project_id", "private_key_id", "private_key", "client_email"}
+)
+# (path, mtime, size) of every credentials file validated so far; only the
+# key is kept, so the private key in the file never stays in memory
+_CREDENTIALS_CACHE: Set[Tuple[str, int, int]] = set()
+
+_SPEECH_CLIENTS: Dict[str, "SpeechClient"] = {}
+_SPEECH_CLIENTS_LOCK = threading.Lock()
+
+
+def _is_api_key(credentials: str) -> bool:
+    """Check whether the credentials look like a Google Cloud API key rather than a file path."""
+    return (
+        credentials.startswith("AIza")
+        and len(credentials) >= 35
+        and "/" not in credentials
+        and "\\" not in credentials
+    )
+
+
+def get_speech_client(credentials: str) -> "SpeechClient":
+    """
+    Get a Google Cloud Speech-to-Text client for the given credentials.
+
+    Clients are created once per credential and reused, so solvers created
+    later in the same process skip the channel setup and authentication.
+
+    Parameters
+    ----------
+    credentials : str
+        Either a path to the Google Cloud credentials JSON file
+        or a Google Cloud API key.
+
+    Returns
+    -------
+    SpeechClient
+        The Speech-to-Text client.
+    """
+    with _SPEECH_CLIENTS_LOCK:
+        client = _SPEECH_CLIENTS.get(credentials)
+
+        if client is None:
+            from google.cloud import speech
+
+            if _is_api_key(credentials):
+                from google.api_core.client_options import ClientOptions
+
+                client_options = ClientOptions(api_key=credentials)
+                client = speech.SpeechClient(client_options=client_options)
+            else:
+                client = speech.SpeechClient.from_service_account_json(credentials)
+
+            _SPEECH_CLIENTS[credentials] = client
+
+    return client
 
 
 class BaseSolver(ABC, Generic[PageT]):
@@ -41,6 +137,9 @@ class BaseSolver(ABC, Generic[PageT]):
         an error if credentials are not provided, by default False.
     debug : bool, optional
         If True, enables detailed debug logging, by default False.
+    speech_client : Optional[SpeechClient], optional
+        The Google Cloud Speech-to-Text client to use with an API key, by default None.
+        If None, a client shared by all solvers using the same API key will be used.
     """
 
     def __init__(
@@ -51,7 +150,8 @@ class BaseSolver(ABC, Generic[PageT]):
         capsolver_api_key: Optional[str] = None,
         google_cloud_credentials: Optional[str] = None,
         force_google_cloud: bool = False,
-        debug: bool = False
+        debug: bool = False,
+        speech_client: Optional["SpeechClient"] = None,
     ) -> None:
         self._page = page
         self._attempts = attempts
@@ -59,6 +159,9 @@ class BaseSolver(ABC, Generic[PageT]):
         self._google_cloud_credentials = google_cloud_credentials or os.getenv("GOOGLE_CLOUD_CREDENTIALS")
         self._force_google_cloud = force_google_cloud
         self._debug = debug
+        self._speech_client = speech_client
+        self._credential_type: Optional[str] = None
+        self._backoff = 1.0
         
         # Set up logger
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -86,8 +189,7 @@ class BaseSolver(ABC, Generic[PageT]):
             self._validate_google_cloud_credentials()
 
         self._token: Optional[str] = None
-        self._payload_response: Union[APIResponse, Response, None] = None
-        self._page.on("response", self._response_callback)
+        self._payload_response: Optional[APIResponse] = None
 
     def __repr__(self) -> str:
         return (
@@ -99,11 +201,12 @@ class BaseSolver(ABC, Generic[PageT]):
         )
 
     def close(self) -> None:
-        """Remove the response listener."""
-        try:
-            self._page.remove_listener("response", self._response_callback)
-        except KeyError:
-            pass
+        """
+        Close the solver.
+
+        The challenge requests are only intercepted while `solve_recaptcha()`
+        runs, so there is nothing left to remove and closing twice is safe.
+        """
 
     def _validate_google_cloud_credentials(self) -> None:
         """
@@ -119,48 +222,236 @@ class BaseSolver(ABC, Generic[PageT]):
         if not self._google_cloud_credentials:
             return
 
-        # Check if it's an API key (starts with 'AIza' and is about 39 characters)
-        if self._google_cloud_credentials.startswith('AIza') and len(self._google_cloud_credentials) >= 35:
+        # API keys need no file checks at all
+        if _is_api_key(self._google_cloud_credentials):
+            self._credential_type = "api_key"
             self._logger.debug("Using Google Cloud API key for authentication")
             return
+
+        self._credential_type = "json"
         
         # Otherwise, treat as a JSON file path
         credentials_path = Path(self._google_cloud_credentials)
         
-        # Check if file exists
-        if not credentials_path.exists():
+        # One try covers the stat for the cache key and the read, a missing
+        # file already shows up in stat() without a separate exists() check
+        try:
+            stat_result = credentials_path.stat()
+            cache_key = (str(credentials_path), stat_result.st_mtime_ns, stat_result.st_size)
+
+            # Skip reading the file again if this version of it was already validated
+            if cache_key in _CREDENTIALS_CACHE:
+                self._logger.debug("Using Google Cloud JSON credentials file for authentication")
+                return
+
+            with open(credentials_path, "rb") as f:
+                credentials_data = _json.loads(f.read())
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Google Cloud credentials file not found: {self._google_cloud_credentials}. "
                 f"Provide either a valid JSON file path or an API key starting with 'AIza'"
-            )
-        
-        # Check if file is readable and valid JSON
-        try:
-            with open(credentials_path, "r", encoding="utf-8") as f:
-                credentials_data = json.load(f)
-        except json.JSONDecodeError as e:
+            ) from None
+        except OSError as e:
             raise ValueError(
-                f"Invalid JSON in Google Cloud credentials file: {self._google_cloud_credentials}. "
+                f"Cannot read Google Cloud credentials file: {self._google_cloud_credentials}. "
                 f"Error: {e}"
             ) from e
-        except (OSError, IOError) as e:
+        except ValueError as e:
             raise ValueError(
-                f"Cannot read Google Cloud credentials file: {self._google_cloud_credentials}. "
+                f"Invalid JSON in Google Cloud credentials file: {self._google_cloud_credentials}. "
                 f"Error: {e}"
             ) from e
         
         # Validate required fields for service account key
-        required_fields = ["type", "project_id", "private_key_id", "private_key", "client_email"]
-        missing_fields = [field for field in required_fields if field not in credentials_data]
+        missing_fields = _REQUIRED_SA_FIELDS.difference(credentials_data)
         
         if missing_fields:
             raise ValueError(
-                f"Google Cloud credentials file is missing required fields: {missing_fields}. "
+                f"Google Cloud credentials file is missing required fields: {sorted(missing_fields)}. "
                 f"Ensure you are using a valid service account key file."
             )
         
+        _CREDENTIALS_CACHE.add(cache_key)
         self._logger.debug("Using Google Cloud JSON credentials file for authentication")
 
+    def _on_rate_limit(self) -> float:
+        """
+        Increase the rate limit backoff after the reCAPTCHA rate limit was hit.
+
+        The solver doesn't wait itself, the delay is handed to the caller
+        through `RecaptchaRateLimitError.retry_after`.
+
+        Returns
+        -------
+        float
+            The suggested time in seconds to wait before solving again.
+        """
+        delay = self._backoff * BACKOFF_BASE_DELAY
+        self._backoff = min(self._backoff * 2, BACKOFF_CAP)
+
+        self._logger.warning(f"reCAPTCHA rate limit hit, suggesting a retry in {delay}s")
+        return delay
+
+    def _on_success(self) -> None:
+        """Decrease the rate limit backoff after a successful solve."""
+        self._backoff = max(self._backoff / 2, 1.0)
+
+    def _get_speech_client(self) -> "SpeechClient":
+        """
+        Get the Google Cloud Speech-to-Text client for this solver.
+
+        Returns
+        -------
+        SpeechClient
+            The client passed to the solver, or the shared client for its credentials.
+        """
+        return self._speech_client or get_speech_client(self._google_cloud_credentials)
+
+    def _decode_mono_audio(self, mp3_data: bytes) -> Optional[AudioSegment]:
+        """
+        Decode the reCAPTCHA MP3 audio and downmix it to mono.
+
+        Parameters
+        ----------
+        mp3_data : bytes
+            The MP3 audio data.
+
+        Returns
+        -------
+        Optional[AudioSegment]
+            The mono audio.
+            Returns None if the audio could not be decoded.
+        """
+        try:
+            audio: AudioSegment = AudioSegment.from_mp3(BytesIO(mp3_data))
+        except CouldntDecodeError as e:
+            self._logger.error(f"Failed to decode MP3 audio: {e}")
+            return None
+
+        self._logger.debug(f"Audio conversion successful, duration: {len(audio)}ms")
+
+        # set_channels() is a no-op for mono audio and downmixes in C otherwise
+        return audio.set_channels(1)
+
+    def _convert_to_mono_wav(self, mp3_data: bytes) -> Optional[bytes]:
+        """
+        Convert the reCAPTCHA audio to mono WAV for the Google Cloud API.
+
+        Parameters
+        ----------
+        mp3_data : bytes
+            The MP3 audio data.
+
+        Returns
+        -------
+        Optional[bytes]
+            The mono WAV audio data.
+            Returns None if the audio could not be decoded.
+        """
+        audio = self._decode_mono_audio(mp3_data)
+
+        if audio is None:
+            return None
+
+        wav_audio = BytesIO()
+        audio.export(wav_audio, format="wav")
+        return wav_audio.getvalue()
+
+    def _convert_to_linear16(self, mp3_data: bytes) -> Optional[bytes]:
+        """
+        Convert the reCAPTCHA audio to raw LINEAR16 PCM for streaming recognition.
+
+        Parameters
+        ----------
+        mp3_data : bytes
+            The MP3 audio data.
+
+        Returns
+        -------
+        Optional[bytes]
+            The 16-bit mono PCM audio data sampled at `STREAMING_SAMPLE_RATE`.
+            Returns None if the audio could not be decoded.
+        """
+        audio = self._decode_mono_audio(mp3_data)
+
+        if audio is None:
+            return None
+
+        audio = audio.set_frame_rate(STREAMING_SAMPLE_RATE).set_sample_width(2)
+        return audio.raw_data
+
+    def _streaming_recognize(
+        self, client: "SpeechClient", pcm_audio: bytes, *, language: str
+    ) -> Optional[str]:
+        """
+        Transcribe audio with Google Cloud streaming recognition.
+
+        The audio is sent in 100 ms chunks and the stream is closed as soon
+        as the first final result arrives.
+
+        Parameters
+        ----------
+        client : SpeechClient
+            The Google Cloud Speech-to-Text client.
+        pcm_audio : bytes
+            The LINEAR16 audio data from `_convert_to_linear16()`.
+        language : str
+            The language of the audio.
+
+        Returns
+        -------
+        Optional[str]
+            The transcript of the first final result.
+            Returns None if no speech was recognized.
+        """
+        from google.cloud import speech
+
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=STREAMING_SAMPLE_RATE,
+                language_code=language,
+            ),
+        )
+
+        requests = (
+            speech.StreamingRecognizeRequest(
+                audio_content=pcm_audio[i : i + STREAMING_CHUNK_SIZE]
+            )
+            for i in range(0, len(pcm_audio), STREAMING_CHUNK_SIZE)
+        )
+
+        responses = client.streaming_recognize(streaming_config, requests)
+
+        try:
+            for response in responses:
+                for result in response.results:
+                    if result.is_final and result.alternatives:
+                        return result.alternatives[0].transcript
+        finally:
+            responses.cancel()
+
+        return None
+
+    @classmethod
+    @abstractmethod
+    def from_context(cls, context: BrowserContext, **kwargs: Any) -> "BaseSolver[PageT]":
+        """
+        Create a solver on a new page in the given browser context.
+
+        Parameters
+        ----------
+        context : BrowserContext
+            The browser context to open the page in.
+        **kwargs
+            Keyword arguments passed to the solver.
+
+        Returns
+        -------
+        BaseSolver[PageT]
+            The solver for the new page.
+        """
+
     @staticmethod
     @abstractmethod
     def _get_task_object(recaptcha_box: RecaptchaBox) -> Optional[str]:
@@ -179,13 +470,24 @@ class BaseSolver(ABC, Generic[PageT]):
         """
 
     @abstractmethod
-    def _response_callback(self, response: Response) -> None:
+    def _route_handler(self, route: Route) -> None:
+        """
+        The route handler for intercepted payload and userverify requests.
+
+        Parameters
+        ----------
+        route : Route
+            The intercepted route.
+        """
+
+    @abstractmethod
+    def _response_callback(self, response: APIResponse) -> None:
         """
         The callback for intercepting payload and userverify responses.
 
         Parameters
         ----------
-        response : Response
+        response : APIResponse
             The response.
         """
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from playwright.sync_api import Browser, Page
+
+from .sync_solver import SyncSolver
+
+
+class SolverPool:
+    """
+    A pool of browser contexts that hands out reCAPTCHA v2 solvers.
+
+    The contexts are created up front from a single browser, so solving on
+    many pages doesn't require launching a browser for each of them.
+
+    Parameters
+    ----------
+    browser : Browser
+        The Playwright browser to create the contexts from.
+    size : int, optional
+        The number of contexts in the pool, by default 2.
+    **solver_kwargs
+        Keyword arguments passed to every `SyncSolver` created by the pool.
+    """
+
+    def __init__(self, browser: Browser, size: int = 2, **solver_kwargs: Any) -> None:
+        self._solver_kwargs = solver_kwargs
+        self._closed = False
+
+        # Every context the pool created, and the ones not checked out right now
+        self._contexts = [browser.new_context() for _ in range(size)]
+        self._available = list(self._contexts)
+
+        # The page each checked out solver was created on
+        self._pages: Dict[SyncSolver, Page] = {}
+
+    def __enter__(self) -> SolverPool:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def acquire(self) -> SyncSolver:
+        """
+        Take a context out of the pool and create a solver on a new page in it.
+
+        The sync Playwright API is bound to a single thread, so no other thread
+        could release a context while this one waited. The pool raises instead
+        of blocking when it has no context left.
+
+        Returns
+        -------
+        SyncSolver
+            The solver.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool is closed or every context is checked out.
+        """
+        if self._closed:
+            raise RuntimeError("The solver pool is closed.")
+
+        if not self._available:
+            raise RuntimeError(
+                "The solver pool is exhausted, release a solver before acquiring another."
+            )
+
+        context = self._available.pop()
+
+        try:
+            page = context.new_page()
+        except Exception:
+            self._available.append(context)
+            raise
+
+        try:
+            solver = SyncSolver(page, **self._solver_kwargs)
+        except Exception:
+            page.close()
+            self._available.append(context)
+            raise
+
+        self._pages[solver] = page
+        return solver
+
+    def release(self, solver: SyncSolver) -> None:
+        """
+        Close a solver and its page, and return its context to the pool.
+
+        Releasing a solver after the pool was closed only closes the solver.
+
+        Parameters
+        ----------
+        solver : SyncSolver
+            The solver returned by `acquire()`.
+
+        Raises
+        ------
+        ValueError
+            If the solver was not acquired from this pool.
+        """
+        solver.close()
+
+        if self._closed:
+            return
+
+        try:
+            page = self._pages.pop(solver)
+        except KeyError:
+            raise ValueError("The solver was not acquired from this pool.") from None
+
+        page.close()
+        self._available.append(page.context)
+
+    def close(self) -> None:
+        """Close every context created by the pool, including those still in use."""
+        if self._closed:
+            return
+
+        self._closed = True
+
+        for context in self._contexts:
+            context.close()
+
+        self._available.clear()
+        self._pages.clear()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from json import JSONDecodeError
@@ -10,7 +11,8 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
 
 import speech_recognition
-from playwright.sync_api import Locator, Page, Response
+from playwright.sync_api import APIResponse, BrowserContext, Locator, Page, Route
+from playwright.sync_api import Error as PlaywrightError
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 from tenacity import Retrying, retry_if_exception_type, stop_after_delay, wait_fixed
@@ -21,7 +23,7 @@ from ..errors import (
     RecaptchaRateLimitError,
     RecaptchaSolveError,
 )
-from .base_solver import BaseSolver
+from .base_solver import CHALLENGE_URL_PATTERN, BaseSolver
 from .recaptcha_box import SyncRecaptchaBox
 from .translations import OBJECT_TRANSLATIONS, ORIGINAL_LANGUAGE_AUDIO
 
@@ -46,6 +48,9 @@ class SyncSolver(BaseSolver[Page]):
     force_google_cloud : bool, optional
         If True, forces the use of Google Cloud Speech-to-Text API and raises
         an error if credentials are not provided, by default False.
+    speech_client : Optional[SpeechClient], optional
+        The Google Cloud Speech-to-Text client to use with an API key, by default None.
+        If None, a client shared by all solvers using the same API key will be used.
     """
 
     def __enter__(self) -> SyncSolver:
@@ -54,6 +59,25 @@ class SyncSolver(BaseSolver[Page]):
     def __exit__(self, *_: Any) -> None:
         self.close()
 
+    @classmethod
+    def from_context(cls, context: BrowserContext, **kwargs: Any) -> SyncSolver:
+        """
+        Create a solver on a new page in the given browser context.
+
+        Parameters
+        ----------
+        context : BrowserContext
+            The browser context to open the page in.
+        **kwargs
+            Keyword arguments passed to the solver.
+
+        Returns
+        -------
+        SyncSolver
+            The solver for the new page.
+        """
+        return cls(context.new_page(), **kwargs)
+
     @staticmethod
     def _get_task_object(recaptcha_box: SyncRecaptchaBox) -> Optional[str]:
         """
@@ -97,13 +121,37 @@ class SyncSolver(BaseSolver[Page]):
 
         return None
 
-    def _response_callback(self, response: Response) -> None:
+    def _route_handler(self, route: Route) -> None:
+        """
+        The route handler for intercepted payload and userverify requests.
+
+        Parameters
+        ----------
+        route : Route
+            The intercepted route.
+        """
+        try:
+            response = route.fetch()
+            route.fulfill(response=response)
+        except PlaywrightError:
+            # Never leave the page's request hanging, let it go through
+            # on its own instead, this attempt just won't see the response
+            try:
+                route.continue_()
+            except PlaywrightError:
+                pass  # The page or the request is already gone
+
+            return
+
+        self._response_callback(response)
+
+    def _response_callback(self, response: APIResponse) -> None:
         """
         The callback for intercepting payload and userverify responses.
 
         Parameters
         ----------
-        response : Response
+        response : APIResponse
             The response.
         """
         if (
@@ -119,6 +167,7 @@ class SyncSolver(BaseSolver[Page]):
 
             if token_match is not None:
                 self._token = token_match.group(1)
+                self._on_success()
 
     def _get_capsolver_response(
         self, recaptcha_box: SyncRecaptchaBox, image_data: bytes
@@ -278,11 +327,8 @@ class SyncSolver(BaseSolver[Page]):
 
         self._logger.debug("Using Google Cloud Speech-to-Text API")
         
-        # Check if we're using an API key or JSON file
-        is_api_key = (self._google_cloud_credentials.startswith('AIza') and 
-                     len(self._google_cloud_credentials) >= 35)
-        
-        if is_api_key:
+        # The credential type was detected when the credentials were validated
+        if self._credential_type == "api_key":
             return self._transcribe_with_api_key(audio_url, language=language)
         else:
             return self._transcribe_with_json_credentials(audio_url, language=language)
@@ -290,43 +336,22 @@ class SyncSolver(BaseSolver[Page]):
     def _transcribe_with_api_key(self, audio_url: str, *, language: str = "en-US") -> Optional[str]:
         """Transcribe using Google Cloud API key."""
         try:
-            from google.cloud import speech
-            from google.api_core.client_options import ClientOptions
-            
-            response = self._page.request.get(audio_url)
-            self._logger.debug(f"Downloaded audio file, size: {len(response.body())} bytes")
+            # Set up the Speech client while the audio is downloading
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                client_future = executor.submit(self._get_speech_client)
+                response = self._page.request.get(audio_url)
+                self._logger.debug(f"Downloaded audio file, size: {len(response.body())} bytes")
 
-            wav_audio = BytesIO()
-            mp3_audio = BytesIO(response.body())
+                audio_content = self._convert_to_linear16(response.body())
+                client = client_future.result()
 
-            try:
-                audio: AudioSegment = AudioSegment.from_mp3(mp3_audio)
-                self._logger.debug(f"Audio conversion successful, duration: {len(audio)}ms")
-            except CouldntDecodeError as e:
-                self._logger.error(f"Failed to decode MP3 audio: {e}")
+            if audio_content is None:
                 return None
 
-            # Convert to mono for Google Cloud API
-            audio = audio.set_channels(1)
-            audio.export(wav_audio, format="wav")
-            wav_audio.seek(0)
-
-            # Use Google Cloud Speech client with API key
-            client_options = ClientOptions(api_key=self._google_cloud_credentials)
-            client = speech.SpeechClient(client_options=client_options)
-
-            audio_content = wav_audio.getvalue()
-            audio = speech.RecognitionAudio(content=audio_content)
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                language_code=language,
-            )
-
             self._logger.debug("Calling Google Cloud Speech API with API key")
-            response = client.recognize(config=config, audio=audio)
+            result = self._streaming_recognize(client, audio_content, language=language)
 
-            if response.results:
-                result = response.results[0].alternatives[0].transcript
+            if result:
                 self._logger.info(f"Google Cloud API transcription successful: '{result}'")
                 print("✅ CAPTCHA solved with your own Google Cloud API keys")
                 return result
@@ -344,21 +369,12 @@ class SyncSolver(BaseSolver[Page]):
             response = self._page.request.get(audio_url)
             self._logger.debug(f"Downloaded audio file, size: {len(response.body())} bytes")
 
-            wav_audio = BytesIO()
-            mp3_audio = BytesIO(response.body())
+            audio_content = self._convert_to_mono_wav(response.body())
 
-            try:
-                audio: AudioSegment = AudioSegment.from_mp3(mp3_audio)
-                self._logger.debug(f"Audio conversion successful, duration: {len(audio)}ms")
-            except CouldntDecodeError as e:
-                self._logger.error(f"Failed to decode MP3 audio: {e}")
+            if audio_content is None:
                 return None
 
-            # Convert to mono for Google Cloud API (JSON credentials path)
-            audio = audio.set_channels(1)
-            audio.export(wav_audio, format="wav")
-            wav_audio.seek(0)
-            
+            wav_audio = BytesIO(audio_content)
             recognizer = speech_recognition.Recognizer()
 
             with speech_recognition.AudioFile(wav_audio) as source:
@@ -717,79 +733,90 @@ class SyncSolver(BaseSolver[Page]):
                 "You must provide a CapSolver API key to solve image challenges."
             )
 
-        self._token = None
-        attempts = attempts or self._attempts
-        self._logger.debug(f"Using {attempts} attempts for solving")
-
-        if wait:
-            retry = Retrying(
-                sleep=self._page.wait_for_timeout,
-                stop=stop_after_delay(wait_timeout),
-                wait=wait_fixed(0.25),
-                retry=retry_if_exception_type(RecaptchaNotFoundError),
-                reraise=True,
-            )
-
-            recaptcha_box = retry(
-                lambda: SyncRecaptchaBox.from_frames(self._page.frames)
-            )
-        else:
-            recaptcha_box = SyncRecaptchaBox.from_frames(self._page.frames)
+        # Only intercept the challenge requests, and only while solving, so
+        # the page's other traffic never has to pass through the solver
+        self._page.route(CHALLENGE_URL_PATTERN, self._route_handler)
 
-        if recaptcha_box.rate_limit_is_visible():
-            raise RecaptchaRateLimitError
+        try:
+            self._token = None
+            attempts = attempts or self._attempts
+            self._logger.debug(f"Using {attempts} attempts for solving")
+
+            if wait:
+                retry = Retrying(
+                    sleep=self._page.wait_for_timeout,
+                    stop=stop_after_delay(wait_timeout),
+                    wait=wait_fixed(0.25),
+                    retry=retry_if_exception_type(RecaptchaNotFoundError),
+                    reraise=True,
+                )
 
-        if recaptcha_box.checkbox.is_visible():
-            click_timestamp = time.time()
-            self._click_checkbox(recaptcha_box)
+                recaptcha_box = retry(
+                    lambda: SyncRecaptchaBox.from_frames(self._page.frames)
+                )
+            else:
+                recaptcha_box = SyncRecaptchaBox.from_frames(self._page.frames)
 
-            if self._token is not None:
-                return self._token
+            if recaptcha_box.rate_limit_is_visible():
+                raise RecaptchaRateLimitError
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not recaptcha_box.any_challenge_is_visible()
-                or recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    self._page.wait_for_timeout(250)
+            if recaptcha_box.checkbox.is_visible():
+                click_timestamp = time.time()
+                self._click_checkbox(recaptcha_box)
 
-                return self._token
+                if self._token is not None:
+                    return self._token
 
-            time_to_wait = max(1 - (time.time() - click_timestamp), 0)
-            self._page.wait_for_timeout(time_to_wait * 1000)
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not recaptcha_box.any_challenge_is_visible()
+                    or recaptcha_box.challenge_is_solved()
+                ):
+                    while self._token is None:
+                        self._page.wait_for_timeout(250)
 
-        while not recaptcha_box.any_challenge_is_visible():
-            self._page.wait_for_timeout(250)
+                    return self._token
 
-        if image_challenge and recaptcha_box.image_challenge_button.is_visible():
-            recaptcha_box.image_challenge_button.click()
-        elif not image_challenge and recaptcha_box.audio_challenge_button.is_visible():
-            recaptcha_box.audio_challenge_button.click()
+                time_to_wait = max(1 - (time.time() - click_timestamp), 0)
+                self._page.wait_for_timeout(time_to_wait * 1000)
 
-        if image_challenge:
-            image = recaptcha_box.image_challenge.locator("img").first
-            image_url = image.get_attribute("src")
-            self._payload_response = self._page.request.get(image_url)
+            while not recaptcha_box.any_challenge_is_visible():
+                self._page.wait_for_timeout(250)
 
-        while attempts > 0:
-            self._token = None
+            if image_challenge and recaptcha_box.image_challenge_button.is_visible():
+                recaptcha_box.image_challenge_button.click()
+            elif not image_challenge and recaptcha_box.audio_challenge_button.is_visible():
+                recaptcha_box.audio_challenge_button.click()
 
             if image_challenge:
-                self._solve_image_challenge(recaptcha_box)
-            else:
-                self._solve_audio_challenge(recaptcha_box)
+                image = recaptcha_box.image_challenge.locator("img").first
+                image_url = image.get_attribute("src")
+                self._payload_response = self._page.request.get(image_url)
 
-            if (
-                recaptcha_box.frames_are_detached()
-                or not recaptcha_box.any_challenge_is_visible()
-                or recaptcha_box.challenge_is_solved()
-            ):
-                while self._token is None:
-                    self._page.wait_for_timeout(250)
+            while attempts > 0:
+                self._token = None
+
+                if image_challenge:
+                    self._solve_image_challenge(recaptcha_box)
+                else:
+                    self._solve_audio_challenge(recaptcha_box)
+
+                if (
+                    recaptcha_box.frames_are_detached()
+                    or not recaptcha_box.any_challenge_is_visible()
+                    or recaptcha_box.challenge_is_solved()
+                ):
+                    while self._token is None:
+                        self._page.wait_for_timeout(250)
 
-                return self._token
+                    return self._token
 
-            attempts -= 1
+                attempts -= 1
 
-        raise RecaptchaSolveError
+            raise RecaptchaSolveError
+        except RecaptchaRateLimitError as error:
+            # Tell the caller how long to back off, longer the more often it happens
+            error.retry_after = self._on_rate_limit()
+            raise
+        finally:
+            self._page.unroute(CHALLENGE_URL_PATTERN, self._route_handler)
@@ -3,10 +3,14 @@
 Quick test on Google's official reCAPTCHA demo.
 """
 
+import os
 import logging
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import expect, sync_playwright
 from playwright_recaptcha import recaptchav2
 
+# Set DEBUG_VISUAL=1 to keep the browser open after each test to see the result
+DEBUG_VISUAL = bool(os.environ.get("DEBUG_VISUAL"))
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -65,9 +69,8 @@ def test_google_recaptcha_demo():
                 print("✅ Check your Google Cloud dashboard for API usage")
                 
                 # Show the submit button is now enabled
-                submit_btn = page.locator('input[type="submit"]')
-                if submit_btn.is_enabled():
-                    print("✅ Submit button is now enabled - reCAPTCHA passed!")
+                expect(page.locator('input[type="submit"]')).to_be_enabled(timeout=5000)
+                print("✅ Submit button is now enabled - reCAPTCHA passed!")
                 
                 return True
                 
@@ -81,8 +84,9 @@ def test_google_recaptcha_demo():
             return False
             
         finally:
-            print("\n⏳ Keeping browser open for 10 seconds to see the result...")
-            page.wait_for_timeout(10000)
+            if DEBUG_VISUAL:
+                print("\n⏳ Keeping browser open for 10 seconds to see the result...")
+                page.wait_for_timeout(10000)
             print("Closing browser...")
             browser.close()
 
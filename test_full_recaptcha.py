@@ -3,14 +3,18 @@
 Test the full reCAPTCHA solver with real Google Cloud API calls.
 """
 
+import os
 import logging
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import expect, sync_playwright
 from playwright_recaptcha import recaptchav2
 
+# Set DEBUG_VISUAL=1 to keep the browser open after each test to see the result
+DEBUG_VISUAL = bool(os.environ.get("DEBUG_VISUAL"))
+
 # Setup detailed logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def test_real_recaptcha_solving():
+def run_real_recaptcha_solving(browser):
     """Test solving actual reCAPTCHA with Google Cloud API."""
     print("🤖 Testing Real reCAPTCHA Solving with Google Cloud API")
     print("=" * 70)
@@ -18,60 +22,59 @@ def test_real_recaptcha_solving():
     print("You should see API usage in your Google Cloud dashboard.")
     print()
     
-    with sync_playwright() as playwright:
-        # Use visible browser to see what's happening
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+    context = browser.new_context()
+    page = context.new_page()
+    
+    try:
+        print("🌐 Navigating to reCAPTCHA demo page...")
+        page.goto("https://www.google.com/recaptcha/api2/demo", timeout=30000)
+        page.wait_for_load_state("networkidle")
         
-        try:
-            print("🌐 Navigating to reCAPTCHA demo page...")
-            page.goto("https://www.google.com/recaptcha/api2/demo", timeout=30000)
-            page.wait_for_load_state("networkidle")
+        print("🔧 Initializing solver with your Google Cloud API key...")
+        with recaptchav2.SyncSolver(
+            page,
+            force_google_cloud=True,  # Force to use your API key
+            debug=True  # Enable detailed logging
+        ) as solver:
             
-            print("🔧 Initializing solver with your Google Cloud API key...")
-            with recaptchav2.SyncSolver(
-                page,
-                force_google_cloud=True,  # Force to use your API key
-                debug=True  # Enable detailed logging
-            ) as solver:
-                
-                print("🚀 Starting reCAPTCHA solving...")
-                print("This will:")
-                print("1. Click the reCAPTCHA checkbox")
-                print("2. If audio challenge appears, download and transcribe it")
-                print("3. Use your Google Cloud API key for transcription")
-                print("4. Submit the result")
-                print()
-                
-                # Attempt to solve
-                token = solver.solve_recaptcha(
-                    wait=True,
-                    wait_timeout=10,
-                    attempts=2  # Limit attempts for testing
-                )
-                
-                print("🎉 SUCCESS!")
-                print(f"✅ reCAPTCHA solved successfully!")
-                print(f"✅ Token: {token[:50]}...")
-                print("✅ Check your Google Cloud dashboard for API usage!")
-                
-                return True
-                
-        except Exception as e:
-            print(f"❌ reCAPTCHA solving failed: {type(e).__name__}: {e}")
-            print("\nThis could be due to:")
-            print("1. reCAPTCHA rate limiting")
-            print("2. Network issues")
-            print("3. reCAPTCHA presenting image challenge instead of audio")
-            print("4. Site blocking automated access")
-            return False
+            print("🚀 Starting reCAPTCHA solving...")
+            print("This will:")
+            print("1. Click the reCAPTCHA checkbox")
+            print("2. If audio challenge appears, download and transcribe it")
+            print("3. Use your Google Cloud API key for transcription")
+            print("4. Submit the result")
+            print()
             
-        finally:
+            # Attempt to solve
+            token = solver.solve_recaptcha(
+                wait=True,
+                wait_timeout=10,
+                attempts=2  # Limit attempts for testing
+            )
+            
+            print("🎉 SUCCESS!")
+            print(f"✅ reCAPTCHA solved successfully!")
+            print(f"✅ Token: {token[:50]}...")
+            print("✅ Check your Google Cloud dashboard for API usage!")
+            
+            return True
+            
+    except Exception as e:
+        print(f"❌ reCAPTCHA solving failed: {type(e).__name__}: {e}")
+        print("\nThis could be due to:")
+        print("1. reCAPTCHA rate limiting")
+        print("2. Network issues")
+        print("3. reCAPTCHA presenting image challenge instead of audio")
+        print("4. Site blocking automated access")
+        return False
+        
+    finally:
+        if DEBUG_VISUAL:
             print("\n⏳ Keeping browser open for 5 seconds to see result...")
             page.wait_for_timeout(5000)
-            browser.close()
+        context.close()
 
-def test_with_custom_page():
+def run_with_custom_page(browser):
     """Test with a simpler reCAPTCHA setup."""
     print("\n🎯 Testing with Custom reCAPTCHA Page")
     print("=" * 70)
@@ -94,47 +97,47 @@ def test_with_custom_page():
     </html>
     """
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+    context = browser.new_context()
+    page = context.new_page()
+    
+    try:
+        # Load a website first to avoid "Invalid domain" error
+        print("🌐 Loading base website...")
+        page.goto("https://www.google.com/", wait_until="commit")
         
-        try:
-            # Load a website first to avoid "Invalid domain" error
-            print("🌐 Loading base website...")
-            page.goto("https://www.google.com/", wait_until="commit")
+        # Set our custom content
+        print("📄 Loading custom reCAPTCHA page...")
+        page.set_content(html_content)
+        expect(page.locator(".g-recaptcha iframe")).to_be_visible()
+        
+        print("🔧 Initializing solver...")
+        with recaptchav2.SyncSolver(
+            page,
+            force_google_cloud=True,
+            debug=True
+        ) as solver:
             
-            # Set our custom content
-            print("📄 Loading custom reCAPTCHA page...")
-            page.set_content(html_content)
-            page.wait_for_timeout(3000)  # Wait for reCAPTCHA to load
+            print("🚀 Attempting to solve custom reCAPTCHA...")
+            token = solver.solve_recaptcha(
+                wait=True,
+                wait_timeout=10,
+                attempts=2
+            )
             
-            print("🔧 Initializing solver...")
-            with recaptchav2.SyncSolver(
-                page,
-                force_google_cloud=True,
-                debug=True
-            ) as solver:
-                
-                print("🚀 Attempting to solve custom reCAPTCHA...")
-                token = solver.solve_recaptcha(
-                    wait=True,
-                    wait_timeout=10,
-                    attempts=2
-                )
-                
-                print("🎉 SUCCESS!")
-                print(f"✅ Custom reCAPTCHA solved!")
-                print(f"✅ Token: {token[:50]}...")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Custom reCAPTCHA test failed: {type(e).__name__}: {e}")
-            return False
+            print("🎉 SUCCESS!")
+            print(f"✅ Custom reCAPTCHA solved!")
+            print(f"✅ Token: {token[:50]}...")
+            return True
             
-        finally:
+    except Exception as e:
+        print(f"❌ Custom reCAPTCHA test failed: {type(e).__name__}: {e}")
+        return False
+        
+    finally:
+        if DEBUG_VISUAL:
             print("⏳ Keeping browser open to see result...")
             page.wait_for_timeout(5000)
-            browser.close()
+        context.close()
 
 def main():
     print("🧪 Full reCAPTCHA Solver Test with Google Cloud API")
@@ -146,20 +149,27 @@ def main():
     
     input("Press Enter to continue with visible browser test (or Ctrl+C to cancel)...")
     
-    # Test 1: Official demo page
-    print("\n" + "="*70)
-    print("TEST 1: Official Google reCAPTCHA Demo")
-    print("="*70)
-    success1 = test_real_recaptcha_solving()
-    
-    if not success1:
-        # Test 2: Custom page if first fails
-        print("\n" + "="*70)
-        print("TEST 2: Custom reCAPTCHA Page")
-        print("="*70)
-        success2 = test_with_custom_page()
-    else:
-        success2 = True
+    # Start the driver and browser once, each test gets its own context
+    with sync_playwright() as playwright:
+        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
+        
+        try:
+            # Test 1: Official demo page
+            print("\n" + "="*70)
+            print("TEST 1: Official Google reCAPTCHA Demo")
+            print("="*70)
+            success1 = run_real_recaptcha_solving(browser)
+            
+            if not success1:
+                # Test 2: Custom page if first fails
+                print("\n" + "="*70)
+                print("TEST 2: Custom reCAPTCHA Page")
+                print("="*70)
+                success2 = run_with_custom_page(browser)
+            else:
+                success2 = True
+        finally:
+            browser.close()
     
     print("\n" + "="*70)
     print("FINAL RESULTS")
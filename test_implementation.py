@@ -14,6 +14,14 @@ from playwright_recaptcha import recaptchav2
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Browser the tests run in; Chromium starts fastest, PWRC_BROWSER=firefox to override
+BROWSER = os.environ.get("PWRC_BROWSER", "chromium")
+
+def _banner(title):
+    """Format a section title between two rules, to be logged as one record."""
+    rule = "=" * 60
+    return f"\n{rule}\n{title}\n{rule}"
+
 def create_mock_credentials():
     """Create a mock credentials file for testing purposes."""
     mock_creds = {
@@ -29,105 +37,72 @@ def create_mock_credentials():
     
     # Create temporary file
     temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-    json.dump(mock_creds, temp_file, indent=2)
+    json.dump(mock_creds, temp_file)
     temp_file.close()
     return temp_file.name
 
-def test_initialization():
+def run_initialization(page):
     """Test various initialization scenarios."""
-    logger.info("=" * 60)
-    logger.info("Testing Initialization Scenarios")
-    logger.info("=" * 60)
+    logger.info(_banner("Testing Initialization Scenarios"))
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        page = browser.new_page()
-        
-        # Test 1: Basic initialization without credentials
-        try:
-            solver = recaptchav2.SyncSolver(page, debug=True)
-            logger.info("✅ Basic initialization successful")
-            solver.close()
-        except Exception as e:
-            logger.error(f"❌ Basic initialization failed: {e}")
-        
-        # Test 2: Force Google Cloud without credentials (should fail)
-        try:
-            solver = recaptchav2.SyncSolver(page, force_google_cloud=True)
-            logger.error("❌ Should have failed with missing credentials")
-            solver.close()
-        except ValueError as e:
-            logger.info(f"✅ Correctly failed when forcing Google Cloud without credentials: {e}")
-        except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
-        
-        # Test 3: With mock credentials file
-        mock_creds_file = None
-        try:
-            mock_creds_file = create_mock_credentials()
-            solver = recaptchav2.SyncSolver(
-                page, 
-                google_cloud_credentials=mock_creds_file,
-                debug=True
-            )
-            logger.info("✅ Mock credentials initialization successful")
-            solver.close()
-        except Exception as e:
-            logger.error(f"❌ Mock credentials initialization failed: {e}")
-        finally:
-            if mock_creds_file and os.path.exists(mock_creds_file):
-                os.unlink(mock_creds_file)
+    mock_creds_file = create_mock_credentials()
+    
+    # (description, solver kwargs, whether initialization should succeed)
+    cases = [
+        ("Basic initialization", {"debug": True}, True),
+        ("Force Google Cloud without credentials", {"force_google_cloud": True}, False),
+        ("Mock credentials initialization", {"google_cloud_credentials": mock_creds_file, "debug": True}, True),
+        ("Force Google Cloud with mock credentials", {"google_cloud_credentials": mock_creds_file, "force_google_cloud": True, "debug": True}, True),
+    ]
+    
+    try:
+        results = []
+        failed = False
         
-        # Test 4: Force Google Cloud with mock credentials
-        mock_creds_file = None
-        try:
-            mock_creds_file = create_mock_credentials()
-            solver = recaptchav2.SyncSolver(
-                page, 
-                google_cloud_credentials=mock_creds_file,
-                force_google_cloud=True,
-                debug=True
-            )
-            logger.info("✅ Force Google Cloud with mock credentials successful")
-            solver.close()
-        except Exception as e:
-            logger.error(f"❌ Force Google Cloud with mock credentials failed: {e}")
-        finally:
-            if mock_creds_file and os.path.exists(mock_creds_file):
-                os.unlink(mock_creds_file)
+        for description, kwargs, should_succeed in cases:
+            try:
+                solver = recaptchav2.SyncSolver(page, **kwargs)
+                solver.close()
+            except ValueError as e:
+                if should_succeed:
+                    results.append(f"❌ {description} failed: {e}")
+                    failed = True
+                else:
+                    results.append(f"✅ {description} correctly failed: {e}")
+            except Exception as e:
+                results.append(f"❌ {description} raised an unexpected error: {e}")
+                failed = True
+            else:
+                if should_succeed:
+                    results.append(f"✅ {description} successful")
+                else:
+                    results.append(f"❌ {description} should have failed")
+                    failed = True
         
-        browser.close()
+        logger.log(logging.ERROR if failed else logging.INFO, "\n".join(results))
+    finally:
+        os.unlink(mock_creds_file)
 
-def test_fallback_behavior():
+def run_fallback_behavior(page):
     """Test the fallback behavior between Google Cloud and free API."""
-    logger.info("=" * 60)
-    logger.info("Testing API Fallback Behavior")
-    logger.info("=" * 60)
+    logger.info(_banner("Testing API Fallback Behavior"))
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        page = browser.new_page()
+    try:
+        # Test without credentials - should use fallback
+        solver = recaptchav2.SyncSolver(page, debug=True)
+        logger.info("✅ Solver initialized for fallback test")
         
-        try:
-            # Test without credentials - should use fallback
-            solver = recaptchav2.SyncSolver(page, debug=True)
-            logger.info("✅ Solver initialized for fallback test")
-            
-            # This won't actually solve a CAPTCHA, but we can test the transcription method
-            # with a mock audio URL to see the fallback behavior
-            logger.info("Solver ready - fallback to free API should be available")
-            solver.close()
-            
-        except Exception as e:
-            logger.error(f"❌ Fallback test failed: {e}")
+        # This won't actually solve a CAPTCHA, but we can test the transcription method
+        # with a mock audio URL to see the fallback behavior
+        logger.info("Solver ready - fallback to free API should be available")
+        solver.close()
         
-        browser.close()
+    except Exception as e:
+        logger.error(f"❌ Fallback test failed: {e}")
 
-def test_with_real_credentials():
+def run_with_real_credentials(page):
     """Test with real credentials if available."""
-    logger.info("=" * 60)
-    logger.info("Testing with Real Credentials (if available)")
-    logger.info("=" * 60)
+    logger.info(_banner("Testing with Real Credentials (if available)"))
     
     # Check for real credentials file
     creds_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
@@ -135,43 +110,46 @@ def test_with_real_credentials():
         logger.warning("⚠️  No real Google Cloud credentials found. Set GOOGLE_APPLICATION_CREDENTIALS environment variable.")
         return
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        page = browser.new_page()
-        
-        try:
-            solver = recaptchav2.SyncSolver(
-                page,
-                google_cloud_credentials=creds_path,
-                force_google_cloud=True,
-                debug=True
-            )
-            logger.info("✅ Real credentials initialization successful")
-            logger.info("🎯 Ready for actual CAPTCHA solving with Google Cloud API")
-            solver.close()
-            
-        except Exception as e:
-            logger.error(f"❌ Real credentials test failed: {e}")
+    try:
+        solver = recaptchav2.SyncSolver(
+            page,
+            google_cloud_credentials=creds_path,
+            force_google_cloud=True,
+            debug=True
+        )
+        logger.info(
+            "✅ Real credentials initialization successful\n"
+            "🎯 Ready for actual CAPTCHA solving with Google Cloud API"
+        )
+        solver.close()
         
-        browser.close()
+    except Exception as e:
+        logger.error(f"❌ Real credentials test failed: {e}")
 
 def main():
     """Run all tests."""
     logger.info("🚀 Starting Playwright-reCAPTCHA Google Cloud Integration Tests")
     
-    test_initialization()
-    test_fallback_behavior()
-    test_with_real_credentials()
+    # None of the tests navigate, so they can all share one page
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, BROWSER).launch(headless=True)
+        page = browser.new_page()
+        
+        run_initialization(page)
+        run_fallback_behavior(page)
+        run_with_real_credentials(page)
+        
+        browser.close()
     
-    logger.info("=" * 60)
-    logger.info("🎉 Test Suite Complete!")
-    logger.info("=" * 60)
-    logger.info("")
-    logger.info("Next Steps:")
-    logger.info("1. Set up real Google Cloud credentials (JSON file)")
-    logger.info("2. Set GOOGLE_APPLICATION_CREDENTIALS environment variable")
-    logger.info("3. Test with actual reCAPTCHA: page.goto('https://www.google.com/recaptcha/api2/demo')")
-    logger.info("4. Use solver.solve_recaptcha(wait=True) for real solving")
+    logger.info("\n".join([
+        _banner("🎉 Test Suite Complete!"),
+        "",
+        "Next Steps:",
+        "1. Set up real Google Cloud credentials (JSON file)",
+        "2. Set GOOGLE_APPLICATION_CREDENTIALS environment variable",
+        "3. Test with actual reCAPTCHA: page.goto('https://www.google.com/recaptcha/api2/demo')",
+        "4. Use solver.solve_recaptcha(wait=True) for real solving",
+    ]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,182 +1,216 @@
 #!/usr/bin/env python3
 """
 Test reCAPTCHA solver on various test sites.
+
+Run as a script for the interactive runner, or collect with pytest; with
+pytest-xdist installed, ``pytest -n 3 test_sites.py`` runs the sites in
+parallel worker processes.
 """
 
+import os
+import re
+import sys
 import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import pytest
 from playwright.sync_api import sync_playwright
 from playwright_recaptcha import recaptchav2
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def test_google_demo():
-    """Test on official Google reCAPTCHA demo."""
-    print("🎯 Testing: Google Official Demo")
-    print("URL: https://www.google.com/recaptcha/api2/demo")
-    print("-" * 60)
+# Set DEBUG_VISUAL=1 to watch the tests in a slowed-down, visible browser
+DEBUG_VISUAL = bool(os.environ.get("DEBUG_VISUAL"))
+
+# Browser the tests run in; Chromium starts fastest, PWRC_BROWSER=firefox to override
+BROWSER = os.environ.get("PWRC_BROWSER", "chromium")
+
+RECAPTCHA_IFRAME = 'iframe[src*="recaptcha"]'
+
+# Third-party requests the demo sites make that the tests don't need
+BLOCKED_URLS = re.compile(r"doubleclick|googletagmanager|google-analytics|googlesyndication|facebook\.net|hotjar|segment\.io")
+BLOCKED_RESOURCE_TYPES = {"font", "media", "image"}
+
+# Never block the widget itself, or the solver has nothing to work with
+RECAPTCHA_URLS = re.compile(r"recaptcha|gstatic")
+
+def _block_request(route):
+    request = route.request
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
-        
-        try:
-            page.goto("https://www.google.com/recaptcha/api2/demo", timeout=30000)
-            page.wait_for_load_state("networkidle")
-            
-            with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
-                token = solver.solve_recaptcha(wait=True, attempts=3)
-                print(f"✅ SUCCESS! Token: {token[:50]}...")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-            return False
-        finally:
-            page.wait_for_timeout(3000)
-            browser.close()
+    if not RECAPTCHA_URLS.search(request.url) and (
+        BLOCKED_URLS.search(request.url) or request.resource_type in BLOCKED_RESOURCE_TYPES
+    ):
+        route.abort()
+    else:
+        route.continue_()
 
-def test_recaptcha_demo_io():
-    """Test on recaptcha-demo.io - a dedicated test site."""
-    print("\n🎯 Testing: reCAPTCHA Demo Site")
-    print("URL: https://recaptcha-demo.io/")
-    print("-" * 60)
+def _install_blocker(context):
+    """Abort tracker, ad and non-essential resource requests made in `context`."""
+    context.route("**/*", _block_request)
+
+@contextmanager
+def shared_browser(visual=DEBUG_VISUAL):
+    """Start Playwright and launch one browser shared by every test in the run."""
+    playwright = sync_playwright().start()
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+    try:
+        browser = getattr(playwright, BROWSER).launch(headless=not visual, slow_mo=1000 if visual else 0)
         
         try:
-            page.goto("https://recaptcha-demo.io/", timeout=30000)
-            page.wait_for_load_state("networkidle")
-            
-            with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
-                token = solver.solve_recaptcha(wait=True, attempts=3)
-                print(f"✅ SUCCESS! Token: {token[:50]}...")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-            return False
+            yield browser
         finally:
-            page.wait_for_timeout(3000)
             browser.close()
+    finally:
+        playwright.stop()
 
-def test_2captcha_demo():
-    """Test on 2captcha demo site."""
-    print("\n🎯 Testing: 2captcha Demo")
-    print("URL: https://2captcha.com/demo/recaptcha-v2")
-    print("-" * 60)
+GOOGLE_DEMO = "https://www.google.com/recaptcha/api2/demo"
+RECAPTCHA_DEMO_IO = "https://recaptcha-demo.io/"
+TWOCAPTCHA_DEMO = "https://2captcha.com/demo/recaptcha-v2"
+
+CUSTOM_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>reCAPTCHA Test</title>
+    <script src="https://www.google.com/recaptcha/api.js" async defer></script>
+    <style>
+        body { font-family: Arial, sans-serif; padding: 50px; }
+        .container { max-width: 500px; margin: 0 auto; text-align: center; }
+        .g-recaptcha { display: inline-block; margin: 20px 0; }
+        button { padding: 10px 20px; font-size: 16px; }
+        .result { margin-top: 20px; padding: 10px; background: #f0f0f0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>reCAPTCHA Test Page</h1>
+        <p>This is a test page for reCAPTCHA solving.</p>
+        
+        <form id="demo-form">
+            <div class="g-recaptcha" data-sitekey="6Le-wvkSAAAAAPBMRTvw0Q4Muexq9bi0DJwx_mJ-"></div>
+            <br>
+            <button type="submit">Submit</button>
+        </form>
+        
+        <div id="result" class="result" style="display:none;">
+            <h3>Success!</h3>
+            <p>reCAPTCHA was solved successfully.</p>
+        </div>
+    </div>
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+    <script>
+        document.getElementById('demo-form').addEventListener('submit', function(e) {
+            e.preventDefault();
+            var response = grecaptcha.getResponse();
+            if (response.length > 0) {
+                document.getElementById('result').style.display = 'block';
+                console.log('reCAPTCHA token:', response);
+            } else {
+                alert('Please complete the reCAPTCHA');
+            }
+        });
+    </script>
+</body>
+</html>
+"""
+
+@pytest.fixture(scope="session")
+def browser():
+    """One browser per test process; under pytest-xdist each worker launches its own."""
+    with shared_browser() as browser:
+        yield browser
+
+def _solve_site(browser, url):
+    """Solve the reCAPTCHA on a demo site in a fresh context and return the token."""
+    context = browser.new_context()
+    _install_blocker(context)
+    page = context.new_page()
+    
+    try:
+        page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        page.wait_for_selector(RECAPTCHA_IFRAME, timeout=15000)
         
-        try:
-            page.goto("https://2captcha.com/demo/recaptcha-v2", timeout=30000)
-            page.wait_for_load_state("networkidle")
-            
-            with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
-                token = solver.solve_recaptcha(wait=True, attempts=3)
-                print(f"✅ SUCCESS! Token: {token[:50]}...")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-            return False
-        finally:
+        with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
+            return solver.solve_recaptcha(wait=True, attempts=3)
+    finally:
+        if DEBUG_VISUAL:
             page.wait_for_timeout(3000)
-            browser.close()
+        context.close()
 
-def test_custom_site():
-    """Create a custom test page."""
-    print("\n🎯 Testing: Custom Test Page")
-    print("Creating custom reCAPTCHA page...")
-    print("-" * 60)
+def _solve_custom_page(browser):
+    """Solve the reCAPTCHA on a custom page served under google.com and return the token."""
+    context = browser.new_context()
+    _install_blocker(context)
+    page = context.new_page()
     
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>reCAPTCHA Test</title>
-        <script src="https://www.google.com/recaptcha/api.js" async defer></script>
-        <style>
-            body { font-family: Arial, sans-serif; padding: 50px; }
-            .container { max-width: 500px; margin: 0 auto; text-align: center; }
-            .g-recaptcha { display: inline-block; margin: 20px 0; }
-            button { padding: 10px 20px; font-size: 16px; }
-            .result { margin-top: 20px; padding: 10px; background: #f0f0f0; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>reCAPTCHA Test Page</h1>
-            <p>This is a test page for reCAPTCHA solving.</p>
-            
-            <form id="demo-form">
-                <div class="g-recaptcha" data-sitekey="6Le-wvkSAAAAAPBMRTvw0Q4Muexq9bi0DJwx_mJ-"></div>
-                <br>
-                <button type="submit">Submit</button>
-            </form>
-            
-            <div id="result" class="result" style="display:none;">
-                <h3>Success!</h3>
-                <p>reCAPTCHA was solved successfully.</p>
-            </div>
-        </div>
+    try:
+        # Load Google first to avoid domain issues
+        page.goto("https://www.google.com/", wait_until="commit")
+        page.set_content(CUSTOM_HTML)
+        page.wait_for_selector(RECAPTCHA_IFRAME, timeout=15000)
         
-        <script>
-            document.getElementById('demo-form').addEventListener('submit', function(e) {
-                e.preventDefault();
-                var response = grecaptcha.getResponse();
-                if (response.length > 0) {
-                    document.getElementById('result').style.display = 'block';
-                    console.log('reCAPTCHA token:', response);
-                } else {
-                    alert('Please complete the reCAPTCHA');
-                }
-            });
-        </script>
-    </body>
-    </html>
-    """
-    
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+        with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
+            token = solver.solve_recaptcha(wait=True, attempts=3)
         
-        try:
-            # Load Google first to avoid domain issues
-            page.goto("https://www.google.com/", wait_until="commit")
-            page.set_content(html_content)
-            page.wait_for_timeout(3000)  # Wait for reCAPTCHA to load
-            
-            with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
-                token = solver.solve_recaptcha(wait=True, attempts=3)
-                print(f"✅ SUCCESS! Token: {token[:50]}...")
-                
-                # Click submit button to see result
-                page.click("button[type='submit']")
-                page.wait_for_timeout(2000)
-                
-                return True
-                
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-            return False
-        finally:
+        # Click submit button to see result
+        page.click("button[type='submit']")
+        
+        if DEBUG_VISUAL:
+            page.wait_for_timeout(2000)
+        
+        return token
+    finally:
+        if DEBUG_VISUAL:
             page.wait_for_timeout(5000)  # Keep open longer to see result
-            browser.close()
+        context.close()
+
+@pytest.mark.parametrize(
+    "url",
+    [GOOGLE_DEMO, RECAPTCHA_DEMO_IO, TWOCAPTCHA_DEMO],
+    ids=["google", "recaptcha-demo-io", "2captcha"],
+)
+def test_site(browser, url):
+    """Test the solver on a public reCAPTCHA demo site."""
+    assert _solve_site(browser, url)
+
+def test_custom_site(browser):
+    """Test the solver on a custom page."""
+    assert _solve_custom_page(browser)
+
+def _report(name, solve, *args):
+    """Run a solve for the script runner and print whether it passed."""
+    print(f"\n🎯 Testing: {name}")
+    print("-" * 60)
+    
+    try:
+        token = solve(*args)
+    except Exception as e:
+        print(f"❌ {name} failed: {e}")
+        return False
+    
+    print(f"✅ {name} SUCCESS! Token: {token[:50]}...")
+    return True
 
-def test_interactive_mode():
-    """Interactive testing mode - choose which site to test."""
+def _run_in_worker(name, solve, *args):
+    """Run a solve in a browser owned by the calling thread.
+    
+    The sync Playwright API is bound to the thread that started it, so a
+    worker thread can't drive the main thread's browser and needs its own.
+    """
+    with shared_browser() as browser:
+        return _report(name, solve, browser, *args)
+
+def run_interactive_mode(site=None):
+    """Interactive testing mode - choose which site to test, or pass its number as `site`."""
     print("\n🎮 Interactive Testing Mode")
     print("=" * 60)
     
     sites = [
-        ("Google Official Demo", "https://www.google.com/recaptcha/api2/demo"),
-        ("reCAPTCHA Demo IO", "https://recaptcha-demo.io/"),
-        ("2captcha Demo", "https://2captcha.com/demo/recaptcha-v2"),
+        ("Google Official Demo", GOOGLE_DEMO),
+        ("reCAPTCHA Demo IO", RECAPTCHA_DEMO_IO),
+        ("2captcha Demo", TWOCAPTCHA_DEMO),
         ("Custom Test Page", "custom")
     ]
     
@@ -187,21 +221,29 @@ def test_interactive_mode():
             print(f"   URL: {url}")
         print()
     
-    try:
-        choice = int(input("Choose a site to test (1-4): "))
-        if choice < 1 or choice > 4:
-            print("Invalid choice")
+    if site is None:
+        if not sys.stdin.isatty():
+            print("No site given; pass --site 1-4 when not running in a terminal")
+            return
+        
+        try:
+            site = int(input("Choose a site to test (1-4): "))
+        except ValueError:
+            print("Invalid input")
             return
-    except ValueError:
-        print("Invalid input")
+    
+    if site < 1 or site > len(sites):
+        print("Invalid choice")
         return
     
-    name, url = sites[choice - 1]
+    name, url = sites[site - 1]
     print(f"\n🚀 Testing {name}...")
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+    # The user picked a site to watch, so always show the browser here
+    with shared_browser(visual=True) as browser:
+        context = browser.new_context()
+        _install_blocker(context)
+        page = context.new_page()
         
         try:
             if url == "custom":
@@ -209,10 +251,9 @@ def test_interactive_mode():
                 page.goto("https://www.google.com/", wait_until="commit")
                 html_content = """<!DOCTYPE html><html><head><title>Test</title><script src="https://www.google.com/recaptcha/api.js" async defer></script></head><body><h1>Test reCAPTCHA</h1><div class="g-recaptcha" data-sitekey="6Le-wvkSAAAAAPBMRTvw0Q4Muexq9bi0DJwx_mJ-"></div></body></html>"""
                 page.set_content(html_content)
-                page.wait_for_timeout(3000)
             else:
-                page.goto(url, timeout=30000)
-                page.wait_for_load_state("networkidle")
+                page.goto(url, timeout=30000, wait_until="domcontentloaded")
+            page.wait_for_selector(RECAPTCHA_IFRAME, timeout=15000)
             
             print("🔧 Initializing solver...")
             with recaptchav2.SyncSolver(page, force_google_cloud=True, debug=True) as solver:
@@ -224,10 +265,22 @@ def test_interactive_mode():
             print(f"❌ Test failed: {e}")
         
         finally:
-            input("\nPress Enter to close browser...")
-            browser.close()
+            if sys.stdin.isatty():
+                input("\nPress Enter to close browser...")
+            
+            context.close()
 
 def main():
+    parser = argparse.ArgumentParser(description="Test the reCAPTCHA solver on public demo sites.")
+    parser.add_argument(
+        "--mode",
+        choices=["all", "interactive", "google"],
+        default="all",
+        help="run all tests automatically, test one site interactively, or run the quick Google demo test",
+    )
+    parser.add_argument("--site", type=int, help="site number to test in interactive mode (1-4)")
+    args = parser.parse_args()
+    
     print("🧪 reCAPTCHA Solver Test Sites")
     print("=" * 60)
     print("These sites are perfect for testing reCAPTCHA solvers:")
@@ -247,14 +300,18 @@ def main():
     print("   - Good for testing different scenarios")
     print()
     
-    choice = input("Choose test mode:\n1. Run all tests automatically\n2. Interactive mode (choose site)\n3. Quick Google demo test\nChoice (1-3): ")
-    
-    if choice == "1":
+    if args.mode == "all":
         print("\n🚀 Running all tests...")
-        results = []
-        results.append(("Google Demo", test_google_demo()))
-        results.append(("reCAPTCHA Demo IO", test_recaptcha_demo_io()))
-        results.append(("Custom Page", test_custom_site()))
+        tests = [
+            ("Google Demo", _solve_site, GOOGLE_DEMO),
+            ("reCAPTCHA Demo IO", _solve_site, RECAPTCHA_DEMO_IO),
+            ("Custom Page", _solve_custom_page),
+        ]
+        
+        # The tests are I/O bound and independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [(name, executor.submit(_run_in_worker, name, *test)) for name, *test in tests]
+            results = [(name, future.result()) for name, future in futures]
         
         print("\n" + "="*60)
         print("FINAL RESULTS")
@@ -263,14 +320,12 @@ def main():
             status = "✅ PASSED" if success else "❌ FAILED"
             print(f"{name}: {status}")
             
-    elif choice == "2":
-        test_interactive_mode()
-        
-    elif choice == "3":
-        test_google_demo()
+    elif args.mode == "interactive":
+        run_interactive_mode(args.site)
         
-    else:
-        print("Invalid choice")
+    elif args.mode == "google":
+        with shared_browser() as browser:
+            _report("Google Demo", _solve_site, browser, GOOGLE_DEMO)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
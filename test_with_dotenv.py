@@ -7,218 +7,260 @@ import os
 import logging
 from dotenv import load_dotenv
 from playwright.sync_api import sync_playwright
-from playwright_recaptcha import recaptchav2
+from playwright_recaptcha import RecaptchaRateLimitError, recaptchav2
 
-# Load environment variables from .env file
+# Load environment variables from .env file, then read the key once
 load_dotenv()
+API_KEY = os.getenv('GOOGLE_CLOUD_CREDENTIALS')
+# Only ever show the start of the key
+API_KEY_PREVIEW = f"{API_KEY[:20]}..." if API_KEY else "<none>"
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-def test_recaptcha_demo():
+# Set DEBUG_VISUAL=1 to watch the solver work in a slowed-down, visible browser
+DEBUG_VISUAL = bool(os.environ.get("DEBUG_VISUAL"))
+
+RECAPTCHA_IFRAME = 'iframe[title*="reCAPTCHA"], iframe[src*="recaptcha"]'
+
+# How often to retry on a fresh page after a rate limit, waiting as long as
+# the solver suggests in between
+RATE_LIMIT_RETRIES = 3
+
+def _banner(title, width=60):
+    """Format a section title followed by a rule, to be logged as one record."""
+    return f"\n{title}\n{'=' * width}"
+
+def solve_with_retries(page, solver):
+    """Solve the reCAPTCHA, reloading the page to retry after a rate limit."""
+    for retry in range(RATE_LIMIT_RETRIES):
+        try:
+            # The iframe is already on the page, so there is no need to wait long for it
+            return solver.solve_recaptcha(wait=True, wait_timeout=5, attempts=5)
+        except RecaptchaRateLimitError as error:
+            if retry == RATE_LIMIT_RETRIES - 1:
+                raise
+            
+            delay = error.retry_after or 0
+            logger.warning("⏳ Rate limited, retrying on a fresh page in %.0fs...", delay)
+            page.wait_for_timeout(delay * 1000)
+            page.reload()
+            page.wait_for_selector(RECAPTCHA_IFRAME, timeout=15000)
+
+def run_recaptcha_demo(browser):
     """Test on Google's official reCAPTCHA demo."""
-    print("🎯 Testing Google reCAPTCHA Demo with dotenv")
-    print("=" * 60)
+    logger.info(_banner("🎯 Testing Google reCAPTCHA Demo with dotenv"))
     
-    # Get API key from environment
-    api_key = os.getenv('GOOGLE_CLOUD_CREDENTIALS')
-    if not api_key:
-        print("❌ No GOOGLE_CLOUD_CREDENTIALS found in .env file")
+    if not API_KEY:
+        logger.error("❌ No GOOGLE_CLOUD_CREDENTIALS found in .env file")
         return False
     
-    print(f"✅ Loaded API key: {api_key[:20]}...")
+    logger.info("✅ Loaded API key: %s", API_KEY_PREVIEW)
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(
-            headless=False,  # Visible browser
-            slow_mo=1500     # Slow down to see actions
-        )
-        page = browser.new_page()
+    context = browser.new_context()
+    page = context.new_page()
+    
+    try:
+        logger.info("🌐 Loading reCAPTCHA demo...")
+        page.goto("https://www.google.com/recaptcha/api2/demo", timeout=60000)
+        page.wait_for_selector(RECAPTCHA_IFRAME, timeout=15000)
         
-        try:
-            print("🌐 Loading reCAPTCHA demo...")
-            page.goto("https://www.google.com/recaptcha/api2/demo", timeout=60000)
-            page.wait_for_load_state("networkidle")
+        logger.info("🔧 Initializing solver with your API key...")
+        with recaptchav2.SyncSolver(
+            page,
+            google_cloud_credentials=API_KEY,
+            force_google_cloud=True,
+            debug=True
+        ) as solver:
             
-            print("🔧 Initializing solver with your API key...")
-            with recaptchav2.SyncSolver(
-                page,
-                google_cloud_credentials=api_key,
-                force_google_cloud=True,
-                debug=True
-            ) as solver:
-                
-                print("🤖 Starting reCAPTCHA solve...")
-                print("👀 Watch the browser window!")
-                print("- It will click the checkbox")
-                print("- If audio challenge appears, it will solve it")
-                print("- Using YOUR Google Cloud API for transcription")
-                
-                token = solver.solve_recaptcha(
-                    wait=True,
-                    wait_timeout=30,
-                    attempts=5
-                )
-                
-                print("\n🎉 SUCCESS!")
-                print(f"✅ reCAPTCHA solved!")
-                print(f"✅ Token: {token[:50]}...")
-                print("✅ CAPTCHA solved with your own Google Cloud API keys")
-                print("✅ Check your Google Cloud dashboard for API usage!")
-                
-                # Verify submit button is enabled
-                try:
-                    submit_btn = page.locator('input[type="submit"]')
-                    if submit_btn.is_enabled():
-                        print("✅ Submit button is now enabled!")
-                        # Optionally click it to see the success page
-                        submit_btn.click()
-                        page.wait_for_timeout(2000)
-                except:
-                    pass
-                
-                return True
-                
-        except Exception as e:
-            print(f"❌ Test failed: {type(e).__name__}")
-            print(f"Error details: {str(e)}")
+            logger.info(
+                "🤖 Starting reCAPTCHA solve...\n"
+                "👀 Watch the browser window!\n"
+                "- It will click the checkbox\n"
+                "- If audio challenge appears, it will solve it\n"
+                "- Using YOUR Google Cloud API for transcription"
+            )
             
-            # Debug information
-            try:
-                print(f"\nDebug info:")
-                print(f"- Page title: {page.title()}")
-                print(f"- Current URL: {page.url}")
-                
-                # Check for reCAPTCHA presence
-                recaptcha = page.locator('iframe[src*="recaptcha"]').first
-                if recaptcha.is_visible():
-                    print("- ✅ reCAPTCHA iframe detected")
-                else:
-                    print("- ❌ reCAPTCHA iframe not found")
-                    
-            except Exception as debug_error:
-                print(f"- Debug failed: {debug_error}")
+            token = solve_with_retries(page, solver)
             
-            return False
+            logger.info(
+                "\n🎉 SUCCESS!\n"
+                "✅ reCAPTCHA solved!\n"
+                "✅ Token: %.50s...\n"
+                "✅ CAPTCHA solved with your own Google Cloud API keys\n"
+                "✅ Check your Google Cloud dashboard for API usage!",
+                token,
+            )
             
-        finally:
-            print("\n⏳ Keeping browser open for 10 seconds...")
+            # Click submit to see the success page; click() waits for it to be enabled
+            page.locator('input[type="submit"]').click(timeout=5000)
+            logger.info("✅ Submit button is now enabled!")
+            
+            return True
+    
+    except RecaptchaRateLimitError:
+        # Let main() decide whether another site is worth trying
+        logger.error("❌ Test failed: rate limited by reCAPTCHA")
+        raise
+    
+    except Exception as e:
+        logger.error("❌ Test failed: %s\nError details: %s", type(e).__name__, e)
+        
+        # Debug information, gathered in a single round-trip to the browser
+        try:
+            info = page.evaluate(
+                """(selector) => ({
+                    title: document.title,
+                    url: location.href,
+                    hasRecap: !!document.querySelector(selector),
+                })""",
+                RECAPTCHA_IFRAME,
+            )
+            logger.info(
+                "\nDebug info:\n- Page title: %s\n- Current URL: %s\n%s",
+                info['title'],
+                info['url'],
+                # Check for reCAPTCHA presence
+                "- ✅ reCAPTCHA iframe detected" if info['hasRecap'] else "- ❌ reCAPTCHA iframe not found",
+            )
+        
+        except Exception as debug_error:
+            logger.error("- Debug failed: %s", debug_error)
+        
+        return False
+    
+    finally:
+        if DEBUG_VISUAL:
+            logger.info("⏳ Keeping browser open for 10 seconds...")
             page.wait_for_timeout(10000)
-            browser.close()
+        context.close()
 
-def test_alternative_site():
+def run_alternative_site(browser):
     """Test on an alternative reCAPTCHA site."""
-    print("\n🎯 Testing Alternative Site")
-    print("=" * 60)
+    logger.info(_banner("🎯 Testing Alternative Site"))
     
-    api_key = os.getenv('GOOGLE_CLOUD_CREDENTIALS')
+    context = browser.new_context()
+    page = context.new_page()
     
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=False, slow_mo=1000)
-        page = browser.new_page()
+    try:
+        logger.info("🌐 Loading alternative test site...")
+        page.goto("https://patrickhlauke.github.io/recaptcha/", timeout=60000)
+        page.wait_for_selector(RECAPTCHA_IFRAME, timeout=15000)
         
-        try:
-            print("🌐 Loading alternative test site...")
-            page.goto("https://patrickhlauke.github.io/recaptcha/", timeout=60000)
-            page.wait_for_load_state("networkidle")
+        with recaptchav2.SyncSolver(
+            page,
+            google_cloud_credentials=API_KEY,
+            force_google_cloud=True,
+            debug=True
+        ) as solver:
             
-            with recaptchav2.SyncSolver(
-                page,
-                google_cloud_credentials=api_key,
-                force_google_cloud=True,
-                debug=True
-            ) as solver:
-                
-                print("🤖 Solving alternative reCAPTCHA...")
-                token = solver.solve_recaptcha(wait=True, attempts=3)
-                
-                print("✅ Alternative site solved!")
-                print(f"Token: {token[:50]}...")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Alternative test failed: {e}")
-            return False
+            logger.info("🤖 Solving alternative reCAPTCHA...")
+            token = solver.solve_recaptcha(wait=True, attempts=3)
             
-        finally:
+            logger.info("✅ Alternative site solved!\nToken: %.50s...", token)
+            return True
+    
+    except Exception as e:
+        logger.error("❌ Alternative test failed: %s", e)
+        return False
+    
+    finally:
+        if DEBUG_VISUAL:
             page.wait_for_timeout(5000)
-            browser.close()
+        context.close()
+
+TEST_SITES = "\n".join([
+    _banner("📋 Available reCAPTCHA Test Sites:"),
+    "1. https://www.google.com/recaptcha/api2/demo",
+    "   - Official Google demo (most reliable)",
+    "",
+    "2. https://patrickhlauke.github.io/recaptcha/",
+    "   - Alternative test page",
+    "",
+    "3. https://recaptcha-demo.io/",
+    "   - Dedicated reCAPTCHA testing",
+    "",
+    "4. https://2captcha.com/demo/recaptcha-v2",
+    "   - Popular service demo",
+])
 
 def show_test_sites():
     """Show available test sites."""
-    print("\n📋 Available reCAPTCHA Test Sites:")
-    print("=" * 60)
-    print("1. https://www.google.com/recaptcha/api2/demo")
-    print("   - Official Google demo (most reliable)")
-    print()
-    print("2. https://patrickhlauke.github.io/recaptcha/")
-    print("   - Alternative test page")
-    print()
-    print("3. https://recaptcha-demo.io/")
-    print("   - Dedicated reCAPTCHA testing")
-    print()
-    print("4. https://2captcha.com/demo/recaptcha-v2")
-    print("   - Popular service demo")
-    print()
+    logger.info(TEST_SITES)
 
 def main():
-    print("🚀 reCAPTCHA Test with python-dotenv")
-    print("=" * 70)
-    print("Using python-dotenv to load .env file properly")
-    print()
+    logger.info("\n".join([
+        _banner("🚀 reCAPTCHA Test with python-dotenv", width=70),
+        "Using python-dotenv to load .env file properly",
+    ]))
     
     # Check if .env file exists
     if not os.path.exists('.env'):
-        print("❌ .env file not found!")
-        print("Create a .env file with:")
-        print("GOOGLE_CLOUD_CREDENTIALS=your_api_key_here")
+        logger.error(
+            "❌ .env file not found!\n"
+            "Create a .env file with:\n"
+            "GOOGLE_CLOUD_CREDENTIALS=your_api_key_here"
+        )
         return
     
     # Check if API key is loaded
-    api_key = os.getenv('GOOGLE_CLOUD_CREDENTIALS')
-    if not api_key:
-        print("❌ GOOGLE_CLOUD_CREDENTIALS not found in .env")
+    if not API_KEY:
+        logger.error("❌ GOOGLE_CLOUD_CREDENTIALS not found in .env")
         return
-        
-    print(f"✅ Environment loaded successfully")
-    print(f"✅ API key found: {api_key[:20]}...")
-    print()
     
-    # Run the main test
-    success = test_recaptcha_demo()
+    logger.info("✅ Environment loaded successfully\n✅ API key found: %s", API_KEY_PREVIEW)
     
-    # If main test fails, try alternative
-    if not success:
-        print("\n🔄 Trying alternative approach...")
-        success = test_alternative_site()
-    
-    print("\n" + "=" * 70)
-    print("FINAL RESULTS")
-    print("=" * 70)
+    with sync_playwright() as playwright:
+        # One driver and browser for both tests; each test opens its own context
+        browser = playwright.firefox.launch(
+            headless=not DEBUG_VISUAL,  # Visible browser only when debugging
+            slow_mo=1500 if DEBUG_VISUAL else 0  # Slow down to see actions
+        )
+        
+        try:
+            # Run the main test
+            try:
+                success = run_recaptcha_demo(browser)
+            except RecaptchaRateLimitError:
+                # Only a rate limit is worth retrying elsewhere; other failures
+                # would fail the same way on the alternative site
+                logger.info("🔄 Trying alternative approach...")
+                success = run_alternative_site(browser)
+        finally:
+            browser.close()
     
     if success:
-        print("🎉 PERFECT! Everything is working!")
-        print("✅ Your Google Cloud API key is active")
-        print("✅ reCAPTCHA solver successfully solved challenges")
-        print("✅ Real API calls were made to Google Cloud")
-        print("✅ Implementation is production-ready")
-        
+        results = [
+            "🎉 PERFECT! Everything is working!",
+            "✅ Your Google Cloud API key is active",
+            "✅ reCAPTCHA solver successfully solved challenges",
+            "✅ Real API calls were made to Google Cloud",
+            "✅ Implementation is production-ready",
+        ]
     else:
-        print("⚠️ Test challenges encountered (this is normal)")
-        print("✅ Your API key is valid (confirmed in earlier tests)")
-        print("✅ Implementation is correct and ready")
-        print("✅ Real API calls work with your key")
-        
-    print("\n🎯 What you accomplished:")
-    print("✅ Rock-solid Google Cloud Speech-to-Text integration")
-    print("✅ Support for both API keys and JSON credentials")
-    print("✅ Comprehensive error handling and logging")
-    print("✅ Production-ready reCAPTCHA solving solution")
-    print("✅ Confirmed API calls to Google Cloud work")
+        results = [
+            "⚠️ Test challenges encountered (this is normal)",
+            "✅ Your API key is valid (confirmed in earlier tests)",
+            "✅ Implementation is correct and ready",
+            "✅ Real API calls work with your key",
+        ]
+    
+    logger.info("\n".join([
+        _banner("FINAL RESULTS", width=70),
+        *results,
+        "",
+        "🎯 What you accomplished:",
+        "✅ Rock-solid Google Cloud Speech-to-Text integration",
+        "✅ Support for both API keys and JSON credentials",
+        "✅ Comprehensive error handling and logging",
+        "✅ Production-ready reCAPTCHA solving solution",
+        "✅ Confirmed API calls to Google Cloud work",
+    ]))
     
     show_test_sites()
     
-    print("\n🚀 Your reCAPTCHA solver is ready for production!")
+    logger.info("🚀 Your reCAPTCHA solver is ready for production!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
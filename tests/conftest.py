@@ -0,0 +1,59 @@
+from typing import AsyncGenerator, Generator
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import Playwright as AsyncPlaywright
+from playwright.async_api import async_playwright
+from playwright.sync_api import Browser, Page, Playwright, sync_playwright
+
+
+# The sync API keeps an event loop running on this thread while it is started,
+# which would block the async tests; module scope stops it before they run
+@pytest.fixture(scope="module")
+def playwright() -> Generator[Playwright, None, None]:
+    """Start one sync Playwright driver for each test module."""
+    with sync_playwright() as playwright:
+        yield playwright
+
+
+@pytest.fixture(scope="module")
+def browser(playwright: Playwright) -> Generator[Browser, None, None]:
+    """Launch one Firefox instance shared by the sync tests of a module."""
+    browser = playwright.firefox.launch()
+    yield browser
+    browser.close()
+
+
+@pytest.fixture
+def page(browser: Browser) -> Generator[Page, None, None]:
+    """Open a page in a fresh context, so each test stays isolated."""
+    context = browser.new_context()
+    yield context.new_page()
+    context.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_playwright_instance() -> AsyncGenerator[AsyncPlaywright, None]:
+    """Start one async Playwright driver for the whole session."""
+    async with async_playwright() as playwright:
+        yield playwright
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_browser(
+    async_playwright_instance: AsyncPlaywright,
+) -> AsyncGenerator[AsyncBrowser, None]:
+    """Launch one Firefox instance shared by the async tests."""
+    browser = await async_playwright_instance.firefox.launch()
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_page(async_browser: AsyncBrowser) -> AsyncGenerator[AsyncPage, None]:
+    """Open a page in a fresh context, so each test stays isolated."""
+    context = await async_browser.new_context()
+    yield await context.new_page()
+    await context.close()
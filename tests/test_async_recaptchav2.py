@@ -1,5 +1,9 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
 import pytest
-from playwright.async_api import async_playwright
+from playwright.async_api import Page, Playwright
 
 from playwright_recaptcha import (
     CapSolverError,
@@ -10,113 +14,111 @@ from playwright_recaptcha import (
 )
 
 
+# The fields base_solver checks for in a service account key file
+SERVICE_ACCOUNT_CREDENTIALS = {
+    "type": "service_account",
+    "project_id": "test-project",
+    "private_key_id": "test-key-id",
+    "private_key": "test-private-key",
+    "client_email": "test@test-project.iam.gserviceaccount.com",
+}
+
+SOLVER_CASES = [
+    pytest.param(
+        {},
+        marks=pytest.mark.xfail(raises=RecaptchaRateLimitError),
+        id="audio-challenge",
+    ),
+    pytest.param(
+        {"image_challenge": True},
+        marks=pytest.mark.xfail(raises=CapSolverError),
+        id="image-challenge",
+    ),
+]
+
+
 @pytest.mark.asyncio
-@pytest.mark.xfail(raises=RecaptchaRateLimitError)
-async def test_solver_with_normal_recaptcha() -> None:
+@pytest.mark.parametrize("solve_kwargs", SOLVER_CASES)
+async def test_solver_with_normal_recaptcha(async_page: Page, solve_kwargs: Dict[str, Any]) -> None:
     """Test the solver with a normal reCAPTCHA."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/recaptcha/api2/demo")
+    # Don't wait for the page to load; solve_recaptcha(wait=True) polls for
+    # the reCAPTCHA while the rest of the page is still loading
+    await async_page.goto("https://www.google.com/recaptcha/api2/demo", wait_until="commit")
 
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True)
+    async with recaptchav2.AsyncSolver(async_page) as solver:
+        await solver.solve_recaptcha(wait=True, **solve_kwargs)
 
 
 @pytest.mark.asyncio
 @pytest.mark.xfail(raises=(RecaptchaNotFoundError, RecaptchaRateLimitError))
-async def test_solver_with_hidden_recaptcha() -> None:
+async def test_solver_with_hidden_recaptcha(async_page: Page) -> None:
     """Test the solver with a hidden reCAPTCHA."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-
-        await page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
-        await page.get_by_role("button").click()
+    await async_page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
+    await async_page.get_by_role("button").click()
 
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True)
+    async with recaptchav2.AsyncSolver(async_page) as solver:
+        await solver.solve_recaptcha(wait=True)
 
 
+@pytest.mark.serial
 @pytest.mark.asyncio
 @pytest.mark.xfail(raises=RecaptchaRateLimitError)
-async def test_solver_with_slow_browser() -> None:
+async def test_solver_with_slow_browser(async_playwright_instance: Playwright) -> None:
     """Test the solver with a slow browser."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch(slow_mo=1000)
+    browser = await async_playwright_instance.firefox.launch(slow_mo=1000)
+
+    try:
         page = await browser.new_page()
         await page.goto("https://www.google.com/recaptcha/api2/demo")
 
         async with recaptchav2.AsyncSolver(page) as solver:
             await solver.solve_recaptcha(wait=True)
+    finally:
+        await browser.close()
 
 
 @pytest.mark.asyncio
-@pytest.mark.xfail(raises=CapSolverError)
-async def test_solver_with_image_challenge() -> None:
-    """Test the solver with an image challenge."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/recaptcha/api2/demo")
+async def test_recaptcha_not_found_error(async_page: Page) -> None:
+    """Test the solver with a page that does not have a reCAPTCHA."""
+    await async_page.goto("about:blank")
 
-        async with recaptchav2.AsyncSolver(page) as solver:
-            await solver.solve_recaptcha(wait=True, image_challenge=True)
+    with pytest.raises(RecaptchaNotFoundError):
+        async with recaptchav2.AsyncSolver(async_page) as solver:
+            await solver.solve_recaptcha()
 
 
 @pytest.mark.asyncio
-async def test_recaptcha_not_found_error() -> None:
-    """Test the solver with a page that does not have a reCAPTCHA."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/")
-
-        with pytest.raises(RecaptchaNotFoundError):
-            async with recaptchav2.AsyncSolver(page) as solver:
-                await solver.solve_recaptcha()
+async def test_google_cloud_credentials_required(async_page: Page) -> None:
+    """Test that Google Cloud credentials are required for audio transcription."""
+    # Test without credentials should raise RecaptchaSolveError when forced
+    with pytest.raises(ValueError, match="Google Cloud credentials are required when force_google_cloud=True"):
+        async with recaptchav2.AsyncSolver(
+            async_page, google_cloud_credentials=None, force_google_cloud=True
+        ) as solver:
+            await solver.solve_recaptcha(wait=True)
 
 
 @pytest.mark.asyncio
-async def test_google_cloud_credentials_required() -> None:
-    """Test that Google Cloud credentials are required for audio transcription."""
-    async with async_playwright() as playwright:
-        browser = await playwright.firefox.launch()
-        page = await browser.new_page()
-        await page.goto("https://www.google.com/recaptcha/api2/demo")
+async def test_google_cloud_credentials_from_env(
+    async_page: Page, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that Google Cloud credentials can be loaded from environment variable."""
+    credentials_path = tmp_path / "credentials.json"
+    credentials_path.write_text(json.dumps(SERVICE_ACCOUNT_CREDENTIALS))
+    monkeypatch.setenv("GOOGLE_CLOUD_CREDENTIALS", str(credentials_path))
 
-        # Test without credentials should raise RecaptchaSolveError when forced
-        with pytest.raises(ValueError, match="Google Cloud credentials are required when force_google_cloud=True"):
-            async with recaptchav2.AsyncSolver(
-                page, google_cloud_credentials=None, force_google_cloud=True
-            ) as solver:
-                await solver.solve_recaptcha(wait=True)
+    # Should not raise an error during initialization
+    solver = recaptchav2.AsyncSolver(async_page)
+    assert solver._google_cloud_credentials == str(credentials_path)
+    solver.close()
 
 
 @pytest.mark.asyncio
-async def test_google_cloud_credentials_from_env() -> None:
-    """Test that Google Cloud credentials can be loaded from environment variable."""
-    import os
-    
-    # Save original value
-    original_creds = os.environ.get("GOOGLE_CLOUD_CREDENTIALS")
-    
-    try:
-        # Set environment variable
-        os.environ["GOOGLE_CLOUD_CREDENTIALS"] = "test-credentials.json"
-        
-        async with async_playwright() as playwright:
-            browser = await playwright.firefox.launch()
-            page = await browser.new_page()
-            
-            # Should not raise an error during initialization
-            solver = recaptchav2.AsyncSolver(page)
-            assert solver._google_cloud_credentials == "test-credentials.json"
-            solver.close()
-    
-    finally:
-        # Restore original value
-        if original_creds is None:
-            os.environ.pop("GOOGLE_CLOUD_CREDENTIALS", None)
-        else:
-            os.environ["GOOGLE_CLOUD_CREDENTIALS"] = original_creds
+async def test_solver_route_handler_can_be_registered(async_page: Page) -> None:
+    """Test that the solver's route handler can be passed to page.route()."""
+    from playwright_recaptcha.recaptchav2.base_solver import CHALLENGE_URL_PATTERN
+
+    async with recaptchav2.AsyncSolver(async_page) as solver:
+        # Playwright stores its wrapper on the handler's owner, as solve_recaptcha() relies on
+        await async_page.route(CHALLENGE_URL_PATTERN, solver._route_handler)
+        await async_page.unroute(CHALLENGE_URL_PATTERN, solver._route_handler)
@@ -1,5 +1,10 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Tuple
+
 import pytest
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Browser, Page, Playwright
 
 from playwright_recaptcha import (
     CapSolverError,
@@ -10,137 +15,288 @@ from playwright_recaptcha import (
 )
 
 
-@pytest.mark.xfail(raises=RecaptchaRateLimitError)
-def test_solver_with_normal_recaptcha() -> None:
+# The fields base_solver checks for in a service account key file
+SERVICE_ACCOUNT_CREDENTIALS = {
+    "type": "service_account",
+    "project_id": "test-project",
+    "private_key_id": "test-key-id",
+    "private_key": "test-private-key",
+    "client_email": "test@test-project.iam.gserviceaccount.com",
+}
+
+SOLVER_CASES = [
+    pytest.param(
+        {},
+        marks=pytest.mark.xfail(raises=RecaptchaRateLimitError),
+        id="audio-challenge",
+    ),
+    pytest.param(
+        {"image_challenge": True},
+        marks=pytest.mark.xfail(raises=CapSolverError),
+        id="image-challenge",
+    ),
+]
+
+
+@pytest.mark.parametrize("solve_kwargs", SOLVER_CASES)
+def test_solver_with_normal_recaptcha(page: Page, solve_kwargs: Dict[str, Any]) -> None:
     """Test the solver with a normal reCAPTCHA."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        page.goto("https://www.google.com/recaptcha/api2/demo")
+    page.goto("https://www.google.com/recaptcha/api2/demo")
 
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True)
+    with recaptchav2.SyncSolver(page) as solver:
+        solver.solve_recaptcha(wait=True, **solve_kwargs)
 
 
 @pytest.mark.xfail(raises=(RecaptchaNotFoundError, RecaptchaRateLimitError))
-def test_solver_with_hidden_recaptcha() -> None:
+def test_solver_with_hidden_recaptcha(page: Page) -> None:
     """Test the solver with a hidden reCAPTCHA."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-
-        page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
-        page.get_by_role("button").click()
+    page.goto("https://www.google.com/recaptcha/api2/demo?invisible=true")
+    page.get_by_role("button").click()
 
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True)
+    with recaptchav2.SyncSolver(page) as solver:
+        solver.solve_recaptcha(wait=True)
 
 
+@pytest.mark.serial
 @pytest.mark.xfail(raises=RecaptchaRateLimitError)
-def test_solver_with_slow_browser() -> None:
+def test_solver_with_slow_browser(playwright: Playwright) -> None:
     """Test the solver with a slow browser."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(slow_mo=1000)
-        page = browser.new_page()
-        page.goto("https://www.google.com/recaptcha/api2/demo")
+    browser = playwright.firefox.launch(slow_mo=1000)
 
-        with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True)
-
-
-@pytest.mark.xfail(raises=CapSolverError)
-def test_solver_with_image_challenge() -> None:
-    """Test the solver with an image challenge."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
+    try:
         page = browser.new_page()
         page.goto("https://www.google.com/recaptcha/api2/demo")
 
         with recaptchav2.SyncSolver(page) as solver:
-            solver.solve_recaptcha(wait=True, image_challenge=True)
+            solver.solve_recaptcha(wait=True)
+    finally:
+        browser.close()
 
 
-def test_recaptcha_not_found_error() -> None:
+def test_recaptcha_not_found_error(page: Page) -> None:
     """Test the solver with a page that does not have a reCAPTCHA."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        page.goto("https://www.google.com/")
+    page.goto("about:blank")
 
-        with pytest.raises(RecaptchaNotFoundError), recaptchav2.SyncSolver(
-            page
-        ) as solver:
-            solver.solve_recaptcha()
+    with pytest.raises(RecaptchaNotFoundError), recaptchav2.SyncSolver(
+        page
+    ) as solver:
+        solver.solve_recaptcha()
 
 
-def test_google_cloud_credentials_required() -> None:
+def test_google_cloud_credentials_required(page: Page) -> None:
     """Test that Google Cloud credentials are required for audio transcription."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        page.goto("https://www.google.com/recaptcha/api2/demo")
+    # Test without credentials should raise ValueError when forced
+    with pytest.raises(ValueError, match="Google Cloud credentials are required when force_google_cloud=True"):
+        recaptchav2.SyncSolver(page, google_cloud_credentials=None, force_google_cloud=True)
 
-        # Test without credentials should raise ValueError when forced
-        with pytest.raises(ValueError, match="Google Cloud credentials are required when force_google_cloud=True"):
-            recaptchav2.SyncSolver(page, google_cloud_credentials=None, force_google_cloud=True)
 
-
-def test_google_cloud_credentials_from_env() -> None:
+def test_google_cloud_credentials_from_env(
+    page: Page, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     """Test that Google Cloud credentials can be loaded from environment variable."""
-    import os
-    
-    # Save original value
-    original_creds = os.environ.get("GOOGLE_CLOUD_CREDENTIALS")
-    
-    try:
-        # Set environment variable
-        os.environ["GOOGLE_CLOUD_CREDENTIALS"] = "test-credentials.json"
-        
-        with sync_playwright() as playwright:
-            browser = playwright.firefox.launch()
-            page = browser.new_page()
-            
-            # Should not raise an error during initialization
-            solver = recaptchav2.SyncSolver(page)
-            assert solver._google_cloud_credentials == "test-credentials.json"
-            solver.close()
-    
-    finally:
-        # Restore original value
-        if original_creds is None:
-            os.environ.pop("GOOGLE_CLOUD_CREDENTIALS", None)
-        else:
-            os.environ["GOOGLE_CLOUD_CREDENTIALS"] = original_creds
+    credentials_path = tmp_path / "credentials.json"
+    credentials_path.write_text(json.dumps(SERVICE_ACCOUNT_CREDENTIALS))
+    monkeypatch.setenv("GOOGLE_CLOUD_CREDENTIALS", str(credentials_path))
 
+    # Should not raise an error during initialization
+    solver = recaptchav2.SyncSolver(page)
+    assert solver._google_cloud_credentials == str(credentials_path)
+    solver.close()
 
-def test_force_google_cloud_without_credentials() -> None:
+
+def test_force_google_cloud_without_credentials(page: Page) -> None:
     """Test that force_google_cloud=True raises error without credentials."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        
-        # Should raise ValueError during initialization
-        with pytest.raises(ValueError, match="Google Cloud credentials are required when force_google_cloud=True"):
-            recaptchav2.SyncSolver(page, force_google_cloud=True)
+    # Should raise ValueError during initialization
+    with pytest.raises(ValueError, match="Google Cloud credentials are required when force_google_cloud=True"):
+        recaptchav2.SyncSolver(page, force_google_cloud=True)
 
 
-def test_force_google_cloud_with_credentials() -> None:
+def test_force_google_cloud_with_credentials(page: Page, tmp_path: Path) -> None:
     """Test that force_google_cloud=True works with credentials provided."""
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch()
-        page = browser.new_page()
-        
-        # Should not raise error during initialization when credentials are provided
-        # (Even though the file doesn't exist, this tests the parameter logic)
-        try:
-            solver = recaptchav2.SyncSolver(
-                page, 
-                google_cloud_credentials="dummy-path.json",
-                force_google_cloud=True
+    credentials_path = tmp_path / "credentials.json"
+    credentials_path.write_text(json.dumps(SERVICE_ACCOUNT_CREDENTIALS))
+
+    solver = recaptchav2.SyncSolver(
+        page,
+        google_cloud_credentials=str(credentials_path),
+        force_google_cloud=True,
+    )
+    assert solver._credential_type == "json"
+    solver.close()
+
+
+def test_google_cloud_credentials_cache(page: Page, tmp_path: Path) -> None:
+    """Test that validated credentials files are cached until they change."""
+    from playwright_recaptcha.recaptchav2 import base_solver
+
+    credentials_path = tmp_path / "credentials.json"
+    credentials_path.write_text(json.dumps(SERVICE_ACCOUNT_CREDENTIALS))
+
+    solver = recaptchav2.SyncSolver(page, google_cloud_credentials=str(credentials_path))
+    solver.close()
+
+    assert any(key[0] == str(credentials_path) for key in base_solver._CREDENTIALS_CACHE)
+
+    # A modified file must be validated again instead of served from the cache
+    credentials_path.write_text("{invalid json")
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        recaptchav2.SyncSolver(page, google_cloud_credentials=str(credentials_path))
+
+
+def test_solver_pool(browser: Browser) -> None:
+    """Test that the solver pool reuses its contexts between solvers."""
+    with recaptchav2.SolverPool(browser, size=1) as pool:
+        solver = pool.acquire()
+        context = solver._page.context
+        pool.release(solver)
+
+        solver = pool.acquire()
+        assert solver._page.context is context
+        pool.release(solver)
+
+
+def test_solver_pool_closes_checked_out_contexts(browser: Browser) -> None:
+    """Test that closing the solver pool also closes contexts still in use."""
+    pool = recaptchav2.SolverPool(browser, size=1)
+    context = pool.acquire()._page.context
+    pool.close()
+
+    assert context not in browser.contexts
+
+
+def test_rate_limit_backoff(page: Page) -> None:
+    """Test that the suggested rate limit delay grows on repeated hits and shrinks on success."""
+    solver = recaptchav2.SyncSolver(page)
+    delays = [solver._on_rate_limit() for _ in range(4)]
+    assert delays == sorted(delays) and delays[0] < delays[-1]
+
+    solver._on_success()
+    assert solver._on_rate_limit() < delays[-1]
+    solver.close()
+
+
+def test_solver_route_handler_can_be_registered(page: Page) -> None:
+    """Test that the solver's route handler can be passed to page.route()."""
+    import weakref
+
+    from playwright_recaptcha.recaptchav2.base_solver import CHALLENGE_URL_PATTERN
+
+    with recaptchav2.SyncSolver(page) as solver:
+        # Playwright stores its wrapper on the handler's owner, as solve_recaptcha() relies on
+        page.route(CHALLENGE_URL_PATTERN, solver._route_handler)
+        page.unroute(CHALLENGE_URL_PATTERN, solver._route_handler)
+
+        assert weakref.ref(solver)() is solver
+
+
+def test_solver_pool_raises_instead_of_blocking(browser: Browser) -> None:
+    """Test that an exhausted or closed solver pool raises instead of blocking."""
+    pool = recaptchav2.SolverPool(browser, size=1)
+    solver = pool.acquire()
+
+    with pytest.raises(RuntimeError, match="exhausted"):
+        pool.acquire()
+
+    pool.close()
+    pool.release(solver)
+
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.acquire()
+
+
+class FakeStreamingResponses:
+    """The response stream of a fake streaming recognition call."""
+
+    def __init__(self, responses: List[Any]) -> None:
+        self._responses = iter(responses)
+        self.consumed = 0
+        self.cancelled = False
+
+    def __iter__(self) -> "FakeStreamingResponses":
+        return self
+
+    def __next__(self) -> Any:
+        response = next(self._responses)
+        self.consumed += 1
+        return response
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class FakeStreamingClient:
+    """A stand-in for SpeechClient that records the streamed audio chunks."""
+
+    def __init__(self, responses: List[Any]) -> None:
+        self.responses = FakeStreamingResponses(responses)
+        self.chunk_sizes: List[int] = []
+
+    def streaming_recognize(self, config: Any, requests: Iterable[Any]) -> FakeStreamingResponses:
+        self.chunk_sizes = [len(request.audio_content) for request in requests]
+        return self.responses
+
+
+def _streaming_response(*results: Tuple[str, bool]) -> SimpleNamespace:
+    """Build a streaming response with one (transcript, is_final) pair per result."""
+    return SimpleNamespace(
+        results=[
+            SimpleNamespace(
+                is_final=is_final,
+                alternatives=[SimpleNamespace(transcript=transcript)],
             )
-            # This will fail on file validation, which is expected
-        except (FileNotFoundError, ValueError) as e:
-            # Expected - file doesn't exist or is invalid
-            assert "not found" in str(e) or "Cannot read" in str(e)
-        else:
-            solver.close()
+            for transcript, is_final in results
+        ]
+    )
+
+
+def test_streaming_recognize_sends_100ms_chunks(page: Page) -> None:
+    """Test that the audio is streamed in 100 ms chunks of 16 kHz LINEAR16."""
+    client = FakeStreamingClient([])
+
+    with recaptchav2.SyncSolver(page) as solver:
+        solver._streaming_recognize(client, bytes(3200 * 2 + 100), language="en-US")
+
+    assert client.chunk_sizes == [3200, 3200, 100]
+
+
+def test_streaming_recognize_stops_after_first_final_result(page: Page) -> None:
+    """Test that the stream is cancelled as soon as the first final result arrives."""
+    client = FakeStreamingClient(
+        [
+            _streaming_response(("hel", False)),
+            _streaming_response(("hello world", True)),
+            _streaming_response(("ignored", True)),
+        ]
+    )
+
+    with recaptchav2.SyncSolver(page) as solver:
+        transcript = solver._streaming_recognize(client, bytes(3200), language="en-US")
+
+    assert transcript == "hello world"
+    assert client.responses.cancelled
+    assert client.responses.consumed == 2
+
+
+def test_streaming_recognize_without_results(page: Page) -> None:
+    """Test that no transcript is returned when nothing was recognized."""
+    client = FakeStreamingClient([_streaming_response(), _streaming_response(("hel", False))])
+
+    with recaptchav2.SyncSolver(page) as solver:
+        assert solver._streaming_recognize(client, bytes(3200), language="en-US") is None
+
+    assert client.responses.cancelled
+
+
+def test_convert_to_linear16(page: Page, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that decoded audio is resampled to 16 kHz 16-bit mono PCM."""
+    from pydub import AudioSegment
+
+    audio = AudioSegment.silent(duration=1000, frame_rate=44100)
+
+    with recaptchav2.SyncSolver(page) as solver:
+        monkeypatch.setattr(solver, "_decode_mono_audio", lambda mp3_data: audio)
+        assert len(solver._convert_to_linear16(b"mp3")) == 16000 * 2
+
+        monkeypatch.setattr(solver, "_decode_mono_audio", lambda mp3_data: None)
+        assert solver._convert_to_linear16(b"mp3") is None